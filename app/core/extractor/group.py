@@ -5,6 +5,8 @@ OCR結果のグルーピング・統合機能
 import re
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple
 
 from app.core.models import SubtitleItem
@@ -12,6 +14,35 @@ from app.core.models import SubtitleItem
 from .ocr import OCRResult
 from .sampler import VideoFrame
 
+try:
+    from rapidfuzz.distance import Levenshtein
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# 正規化用: 全角英数字を半角に、全角の「！」「？」を半角に統一する変換表
+_NORMALIZE_TABLE = str.maketrans(
+    "ａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚ"
+    "ＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺ"
+    "０１２３４５６７８９！？",
+    "abcdefghijklmnopqrstuvwxyz" "ABCDEFGHIJKLMNOPQRSTUVWXYZ" "0123456789!?",
+)
+
+# 正規化で除去する句読点と空白（OCR誤認識対応で空白はすべて除去）
+_NORMALIZE_STRIP_RE = re.compile(r"[。、．，\s]+")
+
+# OCR誤認識補正: 「シ」「チ」に続く大きい「ヤユヨ」を拗音の小書き文字に直す
+_OCR_SMALL_KANA_RE = re.compile(r"(?<=[シチ])[ヤユヨ]")
+_OCR_SMALL_KANA = {"ヤ": "ャ", "ユ": "ュ", "ヨ": "ョ"}
+
+# OCR誤認識補正: 取り違えやすい文字を片方に寄せる変換表
+# （「ロ」「口」→「ロ」、「ニ」「コ」→「ニ」、「0」「O」→「0」、「1」「l」「I」→「1」）
+_OCR_CONFUSABLE_TABLE = str.maketrans({"口": "ロ", "コ": "ニ", "O": "0", "l": "1", "I": "1"})
+
+# 字幕の時間順ソート用キー
+_start_ms = attrgetter("start_ms")
+
 
 @dataclass
 class FrameOCRResult:
@@ -56,14 +87,36 @@ class TextSimilarityCalculator:
         if not text1 or not text2:
             return 0.0
 
+        # 完全一致（正規化後も必ず一致するため正規化を省略）
+        if text1 == text2:
+            return 1.0
+
         # 正規化（空白・記号の統一）
         norm_text1 = TextSimilarityCalculator._normalize_text(text1)
         norm_text2 = TextSimilarityCalculator._normalize_text(text2)
 
+        return TextSimilarityCalculator.calculate_normalized_similarity(norm_text1, norm_text2)
+
+    @staticmethod
+    def calculate_normalized_similarity(norm_text1: str, norm_text2: str) -> float:
+        """
+        正規化済みテキスト同士の類似度を計算（同じテキストを何度も比較する場合用）
+
+        Args:
+            norm_text1: _normalize_text 適用済みのテキスト1
+            norm_text2: _normalize_text 適用済みのテキスト2
+
+        Returns:
+            float: 類似度（0.0-1.0）
+        """
         # 完全一致
         if norm_text1 == norm_text2:
             return 1.0
 
+        # 類似度は対称なので、引数順を揃えて (a, b) と (b, a) でキャッシュを共有
+        if norm_text2 < norm_text1:
+            norm_text1, norm_text2 = norm_text2, norm_text1
+
         # OCR誤認識対応の類似度計算
         ocr_similarity = TextSimilarityCalculator._calculate_ocr_aware_similarity(
             norm_text1, norm_text2
@@ -72,70 +125,34 @@ class TextSimilarityCalculator:
         return ocr_similarity
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_text(text: str) -> str:
-        """テキストの正規化"""
-        # 小文字化
-        normalized = text.lower()
-
-        # 全角・半角の統一
-        normalized = normalized.translate(
-            str.maketrans(
-                "ａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚ"
-                "ＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺ"
-                "０１２３４５６７８９",
-                "abcdefghijklmnopqrstuvwxyz" "ABCDEFGHIJKLMNOPQRSTUVWXYZ" "0123456789",
-            )
-        )
+        """テキストの正規化（同じテキストは一度だけ計算）"""
+        # 小文字化 + 全角・半角と「！」「？」の統一
+        normalized = text.lower().translate(_NORMALIZE_TABLE)
 
-        # 句読点・記号の正規化
-        normalized = re.sub(r"[。、．，]", "", normalized)
-        normalized = re.sub(r"[!！]", "!", normalized)
-        normalized = re.sub(r"[?？]", "?", normalized)
-
-        # 連続空白を1つに & 全ての空白を除去（OCR誤認識対応）
-        normalized = re.sub(r"\s+", "", normalized)
+        # 句読点と空白を1パスで除去
+        normalized = _NORMALIZE_STRIP_RE.sub("", normalized)
 
         return normalized.strip()
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _calculate_ocr_aware_similarity(text1: str, text2: str) -> float:
         """
-        OCR誤認識を考慮した類似度計算
+        OCR誤認識を考慮した類似度計算（同じテキスト対の再計算を避けるためキャッシュ）
         """
         if not text1 or not text2:
             return 0.0
 
-        # 長さの差が大きすぎる場合は低い類似度
-        len_ratio = min(len(text1), len(text2)) / max(len(text1), len(text2))
-        if len_ratio < 0.7:  # 70%未満の長さ差は別テキストと判定
+        # 長さの差が大きすぎる場合は低い類似度（比率は浮動小数の除算を避けて整数で比較）
+        shorter, longer = sorted((len(text1), len(text2)))
+        if shorter * 10 < longer * 7:  # 70%未満の長さ差は別テキストと判定
             return 0.0
 
-        # OCR誤認識の一般的なパターンをマッピング
-        ocr_corrections = {
-            "シヤ": "シャ",
-            "シユ": "シュ",
-            "シヨ": "ショ",
-            "チヤ": "チャ",
-            "チユ": "チュ",
-            "チヨ": "チョ",
-            "ロ": "口",
-            "口": "ロ",  # 「ロ」と「口」の相互変換
-            "ニ": "コ",
-            "コ": "ニ",  # 「ニ」と「コ」の相互変換
-            "0": "O",
-            "O": "0",
-            "1": "l",
-            "l": "1",
-            "I": "1",
-        }
-
-        # OCR補正適用
-        corrected_text1 = text1
-        corrected_text2 = text2
-
-        for wrong, correct in ocr_corrections.items():
-            corrected_text1 = corrected_text1.replace(wrong, correct)
-            corrected_text2 = corrected_text2.replace(wrong, correct)
+        # OCR補正適用（拗音の補正と取り違えやすい文字の統一をそれぞれ1パスで行う）
+        corrected_text1 = TextSimilarityCalculator._apply_ocr_corrections(text1)
+        corrected_text2 = TextSimilarityCalculator._apply_ocr_corrections(text2)
 
         # 補正後の比較
         if corrected_text1 == corrected_text2:
@@ -154,16 +171,26 @@ class TextSimilarityCalculator:
         similarity = 1.0 - (edit_distance / max_len)
 
         # OCR誤認識の場合は類似度を底上げ（1-2文字の違いなら統合対象とする）
-        if edit_distance <= 2 and len_ratio >= 0.9:
+        if edit_distance <= 2 and shorter * 10 >= longer * 9:
             similarity = max(similarity, 0.92)  # 90%閾値を超える値に設定
 
         return similarity
 
+    @staticmethod
+    def _apply_ocr_corrections(text: str) -> str:
+        """OCR誤認識の一般的なパターンを補正"""
+        text = _OCR_SMALL_KANA_RE.sub(lambda m: _OCR_SMALL_KANA[m.group()], text)
+        return text.translate(_OCR_CONFUSABLE_TABLE)
+
     @staticmethod
     def _calculate_edit_distance(s1: str, s2: str) -> int:
         """
         レーベンシュタイン距離（編集距離）を計算
         """
+        # rapidfuzz があればC実装で同じ距離を計算
+        if RAPIDFUZZ_AVAILABLE:
+            return Levenshtein.distance(s1, s2)
+
         if len(s1) < len(s2):
             return TextSimilarityCalculator._calculate_edit_distance(s2, s1)
 
@@ -548,7 +575,7 @@ class ExtractionProcessor:
         subtitles = self._remove_duplicates(subtitles)
 
         # 時間順ソート
-        subtitles.sort(key=lambda x: x.start_ms)
+        subtitles.sort(key=_start_ms)
 
         # インデックス再採番
         for i, subtitle in enumerate(subtitles, 1):
@@ -562,7 +589,7 @@ class ExtractionProcessor:
             return []
 
         # 時間順にソート
-        sorted_subtitles = sorted(subtitles, key=lambda x: x.start_ms)
+        sorted_subtitles = sorted(subtitles, key=_start_ms)
 
         # 時間制約付きの重複統合（近接する類似字幕のみ統合）
         time_aware_merged = self._merge_time_constrained_duplicates(sorted_subtitles)
@@ -583,13 +610,26 @@ class ExtractionProcessor:
         calc = TextSimilarityCalculator()
         max_merge_gap_ms = 30000  # 30秒以内の字幕のみ統合対象とする
 
-        i = 0
-        while i < len(subtitles):
+        # 正規化済みテキストを事前計算（空テキストは比較対象外としてNone）
+        normalized_texts = [
+            calc._normalize_text(subtitle.text) if subtitle.text else None for subtitle in subtitles
+        ]
+
+        # 統合済みの字幕を印で管理する（pop による要素の詰め直しを避ける）
+        consumed = bytearray(len(subtitles))
+
+        for i in range(len(subtitles)):
+            if consumed[i]:
+                continue
+
             current_group = [subtitles[i]]
-            j = i + 1
+            current_normalized = [normalized_texts[i]]
 
             # 現在の字幕から30秒以内の類似字幕を探す
-            while j < len(subtitles):
+            for j in range(i + 1, len(subtitles)):
+                if consumed[j]:
+                    continue
+
                 time_gap = subtitles[j].start_ms - subtitles[i].end_ms
 
                 # 時間間隔が30秒を超えたら統合対象外
@@ -598,17 +638,30 @@ class ExtractionProcessor:
 
                 # 連鎖的重複対応: 既存グループのいずれかとの類似度をチェック
                 is_similar_to_group = False
-                for group_member in current_group:
-                    similarity = calc.calculate_similarity(group_member.text, subtitles[j].text)
-                    if similarity > 0.90:
-                        is_similar_to_group = True
-                        break
+                candidate_normalized = normalized_texts[j]
+                if candidate_normalized is not None:
+                    candidate_len = len(candidate_normalized)
+                    for member_normalized in current_normalized:
+                        if member_normalized is None:
+                            continue
+                        # 長さの比が70%未満の組は類似度が必ず0になるため計算を省略
+                        member_len = len(member_normalized)
+                        if (
+                            member_len * 10 < candidate_len * 7
+                            or candidate_len * 10 < member_len * 7
+                        ):
+                            continue
+                        similarity = calc.calculate_normalized_similarity(
+                            member_normalized, candidate_normalized
+                        )
+                        if similarity > 0.90:
+                            is_similar_to_group = True
+                            break
 
                 if is_similar_to_group:
                     current_group.append(subtitles[j])
-                    subtitles.pop(j)  # 統合対象を削除
-                else:
-                    j += 1
+                    current_normalized.append(candidate_normalized)
+                    consumed[j] = 1  # 統合対象として印を付ける
 
             # グループを統合して追加
             if len(current_group) == 1:
@@ -617,8 +670,6 @@ class ExtractionProcessor:
                 merged_subtitle = self._merge_duplicate_group(current_group)
                 merged.append(merged_subtitle)
 
-            i += 1
-
         return merged
 
     def _merge_overlapping_subtitles(self, subtitles: List[SubtitleItem]) -> List[SubtitleItem]:
@@ -627,15 +678,21 @@ class ExtractionProcessor:
             return []
 
         # 時間順にソート
-        sorted_subtitles = sorted(subtitles, key=lambda x: x.start_ms)
+        sorted_subtitles = sorted(subtitles, key=_start_ms)
         merged = []
         calc = TextSimilarityCalculator()
+        # 比較対象となり得る merged のインデックス（merged 内の順序を保持）
+        active_indices: List[int] = []
 
         for subtitle in sorted_subtitles:
+            # 開始時刻順に処理するため、終了済みの字幕は以降どの字幕とも重複しない
+            active_indices = [i for i in active_indices if merged[i].end_ms > subtitle.start_ms]
+
             # 既存の字幕と時間重複かつテキスト類似度をチェック
             found_overlap = False
 
-            for i, existing in enumerate(merged):
+            for i in active_indices:
+                existing = merged[i]
                 # 時間重複の判定
                 time_overlap = (
                     subtitle.start_ms < existing.end_ms and subtitle.end_ms > existing.start_ms
@@ -662,6 +719,7 @@ class ExtractionProcessor:
                         break
 
             if not found_overlap:
+                active_indices.append(len(merged))
                 merged.append(subtitle)
 
         return merged
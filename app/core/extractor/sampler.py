@@ -75,25 +75,26 @@ class VideoSampler:
             return
 
         original_fps = self._video_info["fps"]
-        frame_interval = int(original_fps / self.sample_fps)
+        frame_interval = max(1, int(original_fps / self.sample_fps))
 
-        frame_number = 0
-        while True:
-            # 指定フレーム位置にシーク
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        # 先頭から順に grab() で読み進め、サンプル対象フレームのみ retrieve() でデコード
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
 
-            ret, frame = self.cap.read()
-            if not ret:
-                break
+        frame_number = 0
+        while self.cap.grab():
+            if frame_number % frame_interval == 0:
+                ret, frame = self.cap.retrieve()
+                if not ret:
+                    break
 
-            # タイムスタンプの計算
-            timestamp_ms = int((frame_number / original_fps) * 1000)
+                # タイムスタンプの計算
+                timestamp_ms = int((frame_number / original_fps) * 1000)
 
-            yield VideoFrame(
-                frame_number=frame_number, timestamp_ms=timestamp_ms, image=frame.copy()
-            )
+                yield VideoFrame(
+                    frame_number=frame_number, timestamp_ms=timestamp_ms, image=frame.copy()
+                )
 
-            frame_number += frame_interval
+            frame_number += 1
 
     def get_frame_at_time(self, time_ms: int) -> VideoFrame:
         """
@@ -18,6 +18,35 @@ from app.core.error_handler import (
 )
 from app.core.models import SubtitleItem
 
+_ENCODING_SNIFF_BYTES = 4096
+
+# SRT解析用の正規表現（モジュール読み込み時に一度だけコンパイル）
+_SRT_TIME_RE = re.compile(r"(\d{2}):(\d{2}):(\d{2}),(\d{3})")
+_SRT_TIME_LINE_RE = re.compile(r"(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})")
+_SRT_ENTRY_SEPARATOR_RE = re.compile(r"\n\s*\n")
+
+
+def _detect_encoding_fast(raw: bytes) -> Optional[str]:
+    """BOMと先頭バイトから確定できるエンコーディングを返す（判定できなければNone）"""
+    if raw.startswith(b"\xef\xbb\xbf"):
+        return "utf-8-sig"
+    if raw.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return "utf-16"
+
+    # 先頭4KBが7bit ASCIIのみならUTF-8として直接デコード
+    if raw[:_ENCODING_SNIFF_BYTES].isascii():
+        return "utf-8"
+
+    return None
+
+
+def _format_srt_time(time_ms: int) -> str:
+    """ミリ秒を "HH:MM:SS,mmm" に変換（divmod連鎖と%書式で高速化）"""
+    hours, rest = divmod(time_ms, 3_600_000)
+    minutes, rest = divmod(rest, 60_000)
+    seconds, milliseconds = divmod(rest, 1000)
+    return "%02d:%02d:%02d,%03d" % (hours, minutes, seconds, milliseconds)
+
 
 @dataclass
 class SRTFormatSettings:
@@ -57,14 +86,7 @@ class SRTFormatter:
         Returns:
             str: SRT時間形式 "HH:MM:SS,mmm"
         """
-        total_seconds = time_ms // 1000
-        milliseconds = time_ms % 1000
-
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+        return _format_srt_time(time_ms)
 
     def parse_time(self, time_str: str) -> int:
         """
@@ -77,8 +99,7 @@ class SRTFormatter:
             int: 時間（ミリ秒）
         """
         # パターンマッチング
-        pattern = r"(\d{2}):(\d{2}):(\d{2}),(\d{3})"
-        match = re.match(pattern, time_str)
+        match = _SRT_TIME_RE.match(time_str)
 
         if not match:
             raise ValueError(f"Invalid SRT time format: {time_str}")
@@ -220,11 +241,9 @@ class SRTFormatter:
         if not subtitles:
             return ""
 
-        srt_entries = []
-
-        for i, subtitle in enumerate(subtitles, 1):
-            entry = self.format_subtitle_entry(i, subtitle)
-            srt_entries.append(entry)
+        srt_entries = [
+            self.format_subtitle_entry(i, subtitle) for i, subtitle in enumerate(subtitles, 1)
+        ]
 
         # エントリ間の空行
         return self.settings.line_separator.join(srt_entries)
@@ -331,8 +350,7 @@ class SRTFormatter:
                 if self.settings.with_bom and self.settings.encoding.lower() == "utf-8":
                     # UTF-8 BOM付き
                     with open(filepath, "wb") as f:
-                        f.write(b"\xef\xbb\xbf")  # BOM
-                        f.write(srt_content.encode("utf-8"))
+                        f.write(srt_content.encode("utf-8-sig"))
                 else:
                     # 通常の保存
                     with open(filepath, "w", encoding=self.settings.encoding, newline="") as f:
@@ -561,6 +579,19 @@ class SRTParser:
 
     def _read_file_with_encoding_enhanced(self, filepath: Path) -> str:
         """エンコーディングを自動検出してファイルを読み込み - 強化版"""
+        with open(filepath, "rb") as f:
+            raw = f.read()
+
+        # BOM・ASCII判定で確定できる場合は候補の総当たりを省略
+        fast_encoding = _detect_encoding_fast(raw)
+        if fast_encoding:
+            try:
+                content = raw.decode(fast_encoding)
+                self.logger.info(f"ファイル読み込み成功: {fast_encoding} エンコーディング")
+                return content
+            except UnicodeDecodeError as e:
+                self.logger.debug(f"エンコーディング {fast_encoding} でデコード失敗: {e}")
+
         encodings = ["utf-8", "utf-8-sig", "shift_jis", "cp932", "euc-jp", "iso-8859-1", "latin1"]
 
         last_error = None
@@ -569,11 +600,10 @@ class SRTParser:
         for encoding in encodings:
             try:
                 self.logger.debug(f"エンコーディング試行: {encoding}")
-                with open(filepath, "r", encoding=encoding) as f:
-                    content = f.read()
-                    if content:  # 空でない場合
-                        self.logger.info(f"ファイル読み込み成功: {encoding} エンコーディング")
-                        return content
+                content = raw.decode(encoding)
+                if content:  # 空でない場合
+                    self.logger.info(f"ファイル読み込み成功: {encoding} エンコーディング")
+                    return content
                 attempted_encodings.append(encoding)
             except UnicodeDecodeError as e:
                 attempted_encodings.append(encoding)
@@ -613,7 +643,7 @@ class SRTParser:
         content = content.replace("\r\n", "\n").replace("\r", "\n")
 
         # エントリごとに分割（空行で区切られている）
-        entries = re.split(r"\n\s*\n", content.strip())
+        entries = _SRT_ENTRY_SEPARATOR_RE.split(content.strip())
 
         for entry in entries:
             if not entry.strip():
@@ -638,9 +668,7 @@ class SRTParser:
 
             # タイムコード行
             time_line = lines[1]
-            time_match = re.match(
-                r"(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})", time_line
-            )
+            time_match = _SRT_TIME_LINE_RE.match(time_line)
 
             if not time_match:
                 return None
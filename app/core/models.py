@@ -5,11 +5,12 @@ DESIGN.mdに基づくSubtitleItemとProjectクラスの実装
 
 import json
 from dataclasses import asdict, dataclass
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleItem:
     """字幕アイテムのデータクラス"""
 
@@ -103,7 +104,7 @@ class Project:
 
     def sort_by_time(self) -> None:
         """時間順にソート"""
-        self.subtitles.sort(key=lambda x: x.start_ms)
+        self.subtitles.sort(key=attrgetter("start_ms"))
         self._reindex()
 
     def to_dict(self) -> Dict[str, Any]:
@@ -146,6 +147,9 @@ class Project:
 class QCResult:
     """QCチェック結果"""
 
+    # 大量に生成されるため、インスタンスごとの __dict__ を持たせない
+    __slots__ = ("subtitle_index", "error_type", "message", "severity")
+
     def __init__(
         self,
         subtitle_index: int,
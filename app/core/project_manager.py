@@ -5,14 +5,58 @@
 
 import json
 import logging
+import mmap
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from app.core.models import Project, ProjectSettings, SubtitleItem
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# この大きさ以上のプロジェクトファイルはmmap経由で解析する
+_MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# 字幕辞書から (開始, 終了, テキスト) を一度に取り出す
+_subtitle_fields = itemgetter("start_time", "end_time", "text")
+
+
+def _read_json(file_path: Path) -> Any:
+    """JSONファイルを読み込み（orjsonがあれば高速パスを使用）"""
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError は json.JSONDecodeError のサブクラス
+        if file_path.stat().st_size >= _MMAP_THRESHOLD_BYTES:
+            # 大きなファイルは読み込みバッファへのコピーを省き、マップした領域を直接解析
+            with open(file_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        return orjson.loads(view)
+
+        return orjson.loads(file_path.read_bytes())
+
+    # ファイル全体を一度に読み込んでから解析
+    return json.loads(file_path.read_bytes().decode("utf-8"))
+
+
+def _write_json(data: Any, file_path: Path) -> None:
+    """JSONファイルを書き込み（インデント2・非ASCII文字はそのまま出力）"""
+    if ORJSON_AVAILABLE:
+        file_path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+
+    # 一括でシリアライズしてから1回の書き込みで保存
+    file_path.write_bytes(json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"))
+
 
 @dataclass
 class ProjectMetadata:
@@ -47,12 +91,8 @@ class ProjectData:
         subtitle_items = []
         for i, subtitle_data in enumerate(self.subtitles):
             try:
-                item = SubtitleItem(
-                    index=i + 1,
-                    start_ms=subtitle_data["start_time"],
-                    end_ms=subtitle_data["end_time"],
-                    text=subtitle_data["text"],
-                )
+                start_ms, end_ms, text = _subtitle_fields(subtitle_data)
+                item = SubtitleItem(index=i + 1, start_ms=start_ms, end_ms=end_ms, text=text)
                 subtitle_items.append(item)
             except (KeyError, TypeError) as e:
                 logging.warning(f"字幕データの読み込みに失敗: {subtitle_data}, エラー: {e}")
@@ -66,12 +106,8 @@ class ProjectData:
         translated_items = []
         for i, trans_data in enumerate(self.translations[language]):
             try:
-                item = SubtitleItem(
-                    index=i + 1,
-                    start_ms=trans_data["start_time"],
-                    end_ms=trans_data["end_time"],
-                    text=trans_data["text"],
-                )
+                start_ms, end_ms, text = _subtitle_fields(trans_data)
+                item = SubtitleItem(index=i + 1, start_ms=start_ms, end_ms=end_ms, text=text)
                 translated_items.append(item)
             except (KeyError, TypeError) as e:
                 logging.warning(f"翻訳データの読み込みに失敗: {trans_data}, エラー: {e}")
@@ -124,8 +160,7 @@ class ProjectManager:
         self.logger.info(f"プロジェクト読み込み開始: {file_path}")
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                project_dict = json.load(f)
+            project_dict = _read_json(file_path)
 
             # バージョン確認
             file_version = project_dict.get("metadata", {}).get("version", "1.0.0")
@@ -180,8 +215,7 @@ class ProjectManager:
             # 親ディレクトリを作成
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(project_dict, f, indent=2, ensure_ascii=False)
+            _write_json(project_dict, file_path)
 
             self.current_project = project_data
             self.current_file_path = file_path
@@ -358,8 +392,7 @@ class ProjectManager:
                 "subtitles": self.current_project.subtitles,
             }
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(legacy_data, f, indent=2, ensure_ascii=False)
+            _write_json(legacy_data, output_path)
 
             self.logger.info(f"レガシー形式でエクスポート完了: {output_path}")
             return True
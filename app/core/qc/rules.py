@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List
 
+import numpy as np
+
 from app.core.models import QCResult, SubtitleItem
 
 
@@ -43,6 +45,10 @@ class LineLengthRule(QCRule):
         results = []
 
         for i, subtitle in enumerate(subtitles):
+            # 全体が制限内なら各行も制限内のため、行分割を省略
+            if len(subtitle.text) <= self.max_chars:
+                continue
+
             lines = subtitle.text.split("\n")
 
             for line_num, line in enumerate(lines, 1):
@@ -70,6 +76,10 @@ class MaxLinesRule(QCRule):
         results = []
 
         for i, subtitle in enumerate(subtitles):
+            # 改行数+1は空行を含む行数の上限なので、制限内なら分割せずに省略
+            if subtitle.text.count("\n") + 1 <= self.max_lines:
+                continue
+
             lines = subtitle.text.split("\n")
             line_count = len([line for line in lines if line.strip()])
 
@@ -143,23 +153,67 @@ class TimeOverlapRule(QCRule):
     def check(self, subtitles: List[SubtitleItem]) -> List[QCResult]:
         results = []
 
-        for i, subtitle1 in enumerate(subtitles):
-            for j, subtitle2 in enumerate(subtitles[i + 1 :], i + 1):
+        if not subtitles:
+            return results
+
+        # 開始時間順に並べた開始・終了時間の配列
+        count = len(subtitles)
+        starts = np.fromiter((s.start_ms for s in subtitles), dtype=np.int64, count=count)
+        ends = np.fromiter((s.end_ms for s in subtitles), dtype=np.int64, count=count)
+        order = np.argsort(starts, kind="stable")
+        sorted_starts = starts[order]
+        sorted_ends = ends[order]
+
+        # 先行する字幕の最大終了時間より前に始まる字幕だけが重複候補
+        running_max_end = np.maximum.accumulate(sorted_ends)
+        is_candidate = np.zeros(count, dtype=bool)
+        is_candidate[1:] = sorted_starts[1:] < running_max_end[:-1]
+
+        order_list = order.tolist()
+        start_list = sorted_starts.tolist()
+        end_list = sorted_ends.tolist()
+        # まだ終了していない字幕（開始時間順の位置）
+        active: List[int] = []
+        overlap_pairs = []
+
+        for p, candidate in enumerate(is_candidate.tolist()):
+            if not candidate:
+                # 先行する字幕はすべて終了済みのため、比較対象を入れ替えるだけ
+                active = [p]
+                continue
+
+            # 現在の開始時間までに終了した字幕は以降の字幕とも重複しない
+            current_start = start_list[p]
+            active = [q for q in active if end_list[q] > current_start]
+
+            j = order_list[p]
+            for q in active:
                 # 時間重複の判定
-                if subtitle1.start_ms < subtitle2.end_ms and subtitle1.end_ms > subtitle2.start_ms:
+                if start_list[q] < end_list[p]:
+                    k = order_list[q]
+                    overlap_pairs.append((min(j, k), max(j, k)))
 
-                    overlap_start = max(subtitle1.start_ms, subtitle2.start_ms)
-                    overlap_end = min(subtitle1.end_ms, subtitle2.end_ms)
-                    overlap_duration = overlap_end - overlap_start
+            active.append(p)
 
-                    results.append(
-                        QCResult(
-                            subtitle_index=i,
-                            error_type="time_overlap",
-                            message=f"字幕{j+1}と時間重複: {overlap_duration/1000:.1f}秒",
-                            severity=QCSeverity.ERROR.value,
-                        )
-                    )
+        # 元の字幕順（i, j の昇順）で報告する
+        overlap_pairs.sort()
+
+        for i, j in overlap_pairs:
+            subtitle1 = subtitles[i]
+            subtitle2 = subtitles[j]
+
+            overlap_start = max(subtitle1.start_ms, subtitle2.start_ms)
+            overlap_end = min(subtitle1.end_ms, subtitle2.end_ms)
+            overlap_duration = overlap_end - overlap_start
+
+            results.append(
+                QCResult(
+                    subtitle_index=i,
+                    error_type="time_overlap",
+                    message=f"字幕{j+1}と時間重複: {overlap_duration/1000:.1f}秒",
+                    severity=QCSeverity.ERROR.value,
+                )
+            )
 
         return results
 
@@ -203,7 +257,9 @@ class EmptyTextRule(QCRule):
         results = []
 
         for i, subtitle in enumerate(subtitles):
-            if not subtitle.text.strip():
+            # strip() と同じ空白判定だが、新しい文字列を作らない
+            text = subtitle.text
+            if not text or text.isspace():
                 results.append(
                     QCResult(
                         subtitle_index=i,
@@ -269,21 +325,24 @@ class ReadingSpeedRule(QCRule):
         results = []
 
         for i, subtitle in enumerate(subtitles):
-            duration_sec = (subtitle.end_ms - subtitle.start_ms) / 1000
-            char_count = len(subtitle.text.replace("\n", "").replace(" ", ""))
+            duration_ms = subtitle.end_ms - subtitle.start_ms
+            if duration_ms <= 0:
+                continue
 
-            if duration_sec > 0:
-                reading_speed = char_count / duration_sec
+            # 改行・空白を除いた文字数（置換後の一時文字列を作らずに数える）
+            text = subtitle.text
+            char_count = len(text) - text.count("\n") - text.count(" ")
+            reading_speed = char_count / (duration_ms / 1000)
 
-                if reading_speed > self.max_chars_per_second:
-                    results.append(
-                        QCResult(
-                            subtitle_index=i,
-                            error_type="reading_speed_too_fast",
-                            message=f"読み速度: {reading_speed:.1f}文字/秒（最大{self.max_chars_per_second}文字/秒）",
-                            severity=QCSeverity.WARNING.value,
-                        )
+            if reading_speed > self.max_chars_per_second:
+                results.append(
+                    QCResult(
+                        subtitle_index=i,
+                        error_type="reading_speed_too_fast",
+                        message=f"読み速度: {reading_speed:.1f}文字/秒（最大{self.max_chars_per_second}文字/秒）",
+                        severity=QCSeverity.WARNING.value,
                     )
+                )
 
         return results
 
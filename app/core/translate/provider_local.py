@@ -2,6 +2,7 @@
 ローカル翻訳プロバイダ（CTranslate2 + MarianMT）の実装
 """
 
+import importlib.util
 import logging
 import os
 import threading
@@ -13,9 +14,9 @@ from typing import Callable, Dict, List, Optional, Tuple
 try:
     import ctranslate2
     import sentencepiece as spm
-    import transformers
 
-    CTRANSLATE2_AVAILABLE = True
+    # transformers は読み込みが重い（torch を伴う）ため、存在確認のみ行い使用時にインポートする
+    CTRANSLATE2_AVAILABLE = importlib.util.find_spec("transformers") is not None
 except ImportError:
     CTRANSLATE2_AVAILABLE = False
     # CTranslate2はローカル翻訳機能でのみ使用され、現在は無効化されているため警告を出力しない
@@ -121,6 +122,8 @@ class ModelManager:
             if not CTRANSLATE2_AVAILABLE:
                 raise LocalTranslateError("CTranslate2が利用できません", "PACKAGE_MISSING")
 
+            import transformers
+
             # Hugging Faceからモデルをロード
             model = transformers.MarianMTModel.from_pretrained(model_id)
             tokenizer = transformers.MarianTokenizer.from_pretrained(model_id)
@@ -178,6 +181,8 @@ class ModelManager:
                     intra_threads=settings.intra_threads,
                 )
 
+                import transformers
+
                 # トークナイザーをロード
                 tokenizer = transformers.MarianTokenizer.from_pretrained(str(model_path))
 
@@ -214,6 +219,16 @@ class ModelManager:
 class LocalTranslateProvider:
     """ローカル翻訳プロバイダ"""
 
+    # サポート言語（言語コード -> 表示名）
+    SUPPORTED_LANGUAGES = {
+        "ja": "日本語",
+        "en": "English",
+        "zh-cn": "中文（简体）",
+        "zh-tw": "中文（繁體）",
+        "ar": "العربية",
+        "ko": "한국어",
+    }
+
     def __init__(self, settings: LocalTranslateSettings):
         self.settings = settings
         self.model_manager = ModelManager(settings.models_dir)
@@ -248,11 +263,8 @@ class LocalTranslateProvider:
 
     def _preprocess_text(self, text: str, src_lang: str) -> str:
         """テキストの前処理"""
-        # 改行を空白に変換
-        text = text.replace("\n", " ").replace("\r", " ")
-        # 連続する空白を単一空白に変換
-        text = " ".join(text.split())
-        return text.strip()
+        # 改行を含む連続する空白を単一空白に変換（str.split() は改行も空白として扱う）
+        return " ".join(text.split())
 
     def _postprocess_text(self, text: str, tgt_lang: str) -> str:
         """テキストの後処理"""
@@ -423,20 +435,11 @@ class LocalTranslateProvider:
 
     def get_supported_languages(self) -> Dict[str, str]:
         """サポートされている言語一覧を取得"""
-        languages = {
-            "ja": "日本語",
-            "en": "English",
-            "zh-cn": "中文（简体）",
-            "zh-tw": "中文（繁體）",
-            "ar": "العربية",
-            "ko": "한국어",
-        }
-        return languages
+        return dict(self.SUPPORTED_LANGUAGES)
 
     def is_language_supported(self, lang_code: str) -> bool:
         """言語がサポートされているかチェック"""
-        supported_langs = set(self.get_supported_languages().keys())
-        return lang_code in supported_langs
+        return lang_code in self.SUPPORTED_LANGUAGES
 
     def get_error_guidance(self, error: LocalTranslateError) -> str:
         """エラー種別に応じたユーザ向けガイダンス"""
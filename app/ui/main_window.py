@@ -170,6 +170,9 @@ class MainWindow(QMainWindow):
         # 抽出ワーカー
         self.extraction_worker: Optional[ExtractionWorker] = None
 
+        # QCチェッカー（ルール構成は固定のため、チェックのたびに再構築せず使い回す）
+        self.qc_checker = QCChecker()
+
         self.init_ui()
         self.connect_signals()
         self.setup_shortcuts()
@@ -972,11 +975,10 @@ class MainWindow(QMainWindow):
 
         try:
             # QCチェッカーでチェック実行
-            qc_checker = QCChecker()
-            qc_results = qc_checker.check_all(self.current_project.subtitles)
+            qc_results = self.qc_checker.check_all(self.current_project.subtitles)
 
             # 結果のサマリー
-            summary = qc_checker.get_summary(qc_results)
+            summary = self.qc_checker.get_summary(qc_results)
 
             # 結果表示
             self.show_qc_results(qc_results, summary)
@@ -2,15 +2,55 @@
 テスト設定ファイル
 """
 
+import copy
+import os
 import sys
 from pathlib import Path
 
 import pytest
 from PySide6.QtWidgets import QApplication
 
-# プロジェクトルートをPythonパスに追加
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# tmp_path を RAM 上に置くための設定（Linux のみ）
+SHM_DIR = Path("/dev/shm")
+SHM_MIN_FREE_BYTES = 512 * 1024 * 1024  # 大容量ファイルテストの書き込み分を確保
+
+
+def _shm_available() -> bool:
+    """/dev/shm を tmp_path の基点として使えるか確認"""
+    if not sys.platform.startswith("linux"):
+        return False
+    if not (SHM_DIR.is_dir() and os.access(SHM_DIR, os.W_OK)):
+        return False
+    stat = os.statvfs(SHM_DIR)
+    return stat.f_bavail * stat.f_frsize >= SHM_MIN_FREE_BYTES
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """I/O中心のテストを高速化するため、tmp_path を /dev/shm 配下に作成する
+
+    pytest 標準のユーザー別・実行番号付きのディレクトリ構成（pytest-of-<user>/pytest-N）を
+    /dev/shm 上に作らせるため、基点だけを差し替える。同時実行や他ユーザーの実行と
+    衝突せず、直近の実行結果も保持される。--basetemp や PYTEST_DEBUG_TEMPROOT が
+    明示された場合はそちらを優先する。
+    """
+    if config.option.basetemp is None and _shm_available():
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(SHM_DIR))
+
+    # xdist の各ワーカーが OpenMP スレッドプールを持つと過剰並列になるため単一スレッドに固定
+    # （ライブラリ読み込み前に設定する必要がある）
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _single_threaded_cv2():
+    """OpenCV の内部スレッドを1本に制限（並列ワーカー間のスレッド競合を防ぐ）"""
+    try:
+        import cv2
+    except ImportError:
+        return
+
+    cv2.setNumThreads(1)
 
 
 @pytest.fixture(scope="session")
@@ -22,16 +62,66 @@ def qapp():
     yield app
 
 
-@pytest.fixture
-def sample_subtitles():
-    """テスト用字幕データ"""
+@pytest.fixture(scope="session")
+def srt_parser():
+    """セッション共有のSRTパーサー"""
+    from app.core.format.srt import SRTParser
+
+    return SRTParser()
+
+
+@pytest.fixture(scope="session")
+def srt_formatter():
+    """セッション共有のSRTフォーマッタ（設定は読み取り専用で使用）"""
+    from app.core.format.srt import SRTFormatter
+
+    return SRTFormatter()
+
+
+@pytest.fixture(scope="session")
+def error_handler():
+    """セッション共有のエラーハンドラー"""
+    from app.core.error_handler import ErrorHandler
+
+    return ErrorHandler()
+
+
+@pytest.fixture(scope="module")
+def project_manager():
+    """モジュール共有のプロジェクトマネージャー（current_project を保持するため module スコープ）"""
+    from app.core.project_manager import ProjectManager
+
+    return ProjectManager()
+
+
+@pytest.fixture(scope="session")
+def _sample_subtitles_data():
+    """セッション内で共有するテスト用字幕データの原本（テストには複製を渡す）"""
     from app.core.models import SubtitleItem
 
-    return [
+    return (
         SubtitleItem(index=1, start_ms=1000, end_ms=3000, text="こんにちは世界"),
         SubtitleItem(index=2, start_ms=4000, end_ms=6000, text="これはテストです"),
         SubtitleItem(index=3, start_ms=7000, end_ms=9000, text="最後の字幕"),
-    ]
+    )
+
+
+@pytest.fixture
+def sample_subtitles(_sample_subtitles_data):
+    """テスト用字幕データ（リスト・要素ともテストごとに複製）
+
+    Project._reindex やテーブル編集は要素をその場で変更するため、要素も複製して
+    テスト間で変更が漏れないようにする。
+    """
+    return [copy.copy(subtitle) for subtitle in _sample_subtitles_data]
+
+
+@pytest.fixture(scope="session")
+def single_subtitle():
+    """書き込み系テスト用の1件だけの字幕データ（変更しないこと）"""
+    from app.core.models import SubtitleItem
+
+    return (SubtitleItem(1, 1000, 3000, "テスト"),)
 
 
 @pytest.fixture
@@ -4,6 +4,7 @@ CSV エクスポート・インポート機能の統合テスト
 外部翻訳ワークフロー（GAS連携）のためのCSV機能のテスト
 """
 
+import contextlib
 import csv
 import tempfile
 from pathlib import Path
@@ -15,6 +16,28 @@ from app.core.csv.importer import SubtitleCSVImporter
 from app.core.models import SubtitleItem
 
 
+@contextlib.contextmanager
+def managed_tmp(suffix: str, content: bytes = b""):
+    """一時ファイルを作成し、ブロック終了時に確実に削除する"""
+    with tempfile.NamedTemporaryFile(mode="wb", suffix=suffix, delete=False) as f:
+        if content:
+            f.write(content)
+        path = Path(f.name)
+
+    try:
+        yield path
+    finally:
+        with contextlib.suppress(OSError):
+            path.chmod(0o666)
+            path.unlink()
+
+
+def _write_csv_rows(path: Path, rows) -> None:
+    """CSV行をUTF-8で書き込み"""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows(rows)
+
+
 class TestCSVExportImportIntegration:
     """CSV エクスポート・インポート統合テスト"""
 
@@ -55,12 +78,7 @@ class TestCSVExportImportIntegration:
 
     def test_export_roundtrip(self, sample_subtitles_japanese):
         """エクスポートの往復テスト"""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False, encoding="utf-8"
-        ) as f:
-            csv_path = Path(f.name)
-
-        try:
+        with managed_tmp(".csv") as csv_path:
             # Step 1: エクスポート
             exporter = SubtitleCSVExporter()
             success = exporter.export_for_translation(
@@ -77,21 +95,11 @@ class TestCSVExportImportIntegration:
                 assert "こんにちは、世界！" in content, "日本語テキストがエクスポートされていない"
                 assert "00:01.000" in content, "タイムコードがエクスポートされていない"
 
-        finally:
-            # クリーンアップ
-            if csv_path.exists():
-                csv_path.unlink()
-
     def test_translated_csv_import(self, sample_translated_csv_content, sample_subtitles_japanese):
         """翻訳済みCSVのインポートテスト"""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False, encoding="utf-8", newline=""
-        ) as f:
-            csv_path = Path(f.name)
-            writer = csv.writer(f)
-            writer.writerows(sample_translated_csv_content)
-
-        try:
+        with managed_tmp(".csv") as csv_path:
+            _write_csv_rows(csv_path, sample_translated_csv_content)
+
             # 翻訳済みCSVをインポート
             importer = SubtitleCSVImporter()
             result = importer.import_translated_csv(csv_path, sample_subtitles_japanese)
@@ -112,48 +120,35 @@ class TestCSVExportImportIntegration:
                         "Hello, World!" in first_subtitle.text
                     ), f"翻訳テキストが正しくない: '{first_subtitle.text}'"
 
-        finally:
-            # クリーンアップ
-            if csv_path.exists():
-                csv_path.unlink()
-
     def test_csv_encoding_handling(self, sample_subtitles_japanese):
         """CSV文字エンコーディングのテスト"""
         encodings_to_test = ["utf-8", "utf-8-sig"]  # BOM付きUTF-8も含む
 
         for encoding in encodings_to_test:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".csv", delete=False, encoding=encoding
-            ) as f:
-                csv_path = Path(f.name)
-
-            try:
-                # エクスポート
-                exporter = SubtitleCSVExporter()
-                success = exporter.export_for_translation(
-                    subtitles=sample_subtitles_japanese, filepath=csv_path
-                )
-
-                assert success, f"エンコーディング '{encoding}' でエクスポートに失敗"
+            with managed_tmp(".csv") as csv_path:
+                try:
+                    # エクスポート
+                    exporter = SubtitleCSVExporter()
+                    success = exporter.export_for_translation(
+                        subtitles=sample_subtitles_japanese, filepath=csv_path
+                    )
 
-                # ファイルが存在し、内容が正しいことを確認
-                assert (
-                    csv_path.exists()
-                ), f"エンコーディング '{encoding}' でファイルが作成されていない"
+                    assert success, f"エンコーディング '{encoding}' でエクスポートに失敗"
 
-                # 文字化けしていないことを確認
-                with open(csv_path, "r", encoding=encoding) as f:
-                    content = f.read()
+                    # ファイルが存在し、内容が正しいことを確認
                     assert (
-                        "こんにちは" in content
-                    ), f"エンコーディング '{encoding}' で文字化けが発生"
+                        csv_path.exists()
+                    ), f"エンコーディング '{encoding}' でファイルが作成されていない"
 
-            except UnicodeError:
-                pytest.skip(f"エンコーディング {encoding} では特殊文字が扱えない")
+                    # 文字化けしていないことを確認
+                    with open(csv_path, "r", encoding=encoding) as f:
+                        content = f.read()
+                        assert (
+                            "こんにちは" in content
+                        ), f"エンコーディング '{encoding}' で文字化けが発生"
 
-            finally:
-                if csv_path.exists():
-                    csv_path.unlink()
+                except UnicodeError:
+                    pytest.skip(f"エンコーディング {encoding} では特殊文字が扱えない")
 
     def test_csv_special_characters_handling(self):
         """CSV特殊文字の処理テスト"""
@@ -165,12 +160,7 @@ class TestCSVExportImportIntegration:
             SubtitleItem(5, 13000, 15000, '両方"カンマ,改行\n"含む'),
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False, encoding="utf-8"
-        ) as f:
-            csv_path = Path(f.name)
-
-        try:
+        with managed_tmp(".csv") as csv_path:
             # エクスポート
             exporter = SubtitleCSVExporter()
             success = exporter.export_for_translation(
@@ -185,10 +175,6 @@ class TestCSVExportImportIntegration:
                 content = f.read()
                 assert "カンマ含む" in content, "カンマを含むテキストが正しく処理されていない"
 
-        finally:
-            if csv_path.exists():
-                csv_path.unlink()
-
     def test_csv_validation_and_error_handling(self):
         """CSV検証とエラーハンドリングのテスト"""
         importer = SubtitleCSVImporter()
@@ -198,20 +184,11 @@ class TestCSVExportImportIntegration:
         assert result.success == False, "存在しないファイルでもsuccessがTrue"
 
         # 不正なCSV形式
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False, encoding="utf-8"
-        ) as f:
-            csv_path = Path(f.name)
-            f.write("Invalid,CSV,Format\n")
-            f.write("Missing,Columns\n")
-
-        try:
+        invalid_csv = "Invalid,CSV,Format\nMissing,Columns\n".encode("utf-8")
+        with managed_tmp(".csv", invalid_csv) as csv_path:
             result = importer.import_translated_csv(csv_path, [])
             # エラーが適切に処理されることを確認（成功しないはず）
             assert not result.success, "不正なCSVが正常に処理された"
-        finally:
-            if csv_path.exists():
-                csv_path.unlink()
 
     def test_large_csv_performance(self):
         """大量データCSVのパフォーマンステスト"""
@@ -225,12 +202,7 @@ class TestCSVExportImportIntegration:
             text = f"字幕番号 {i+1}: これは長いテキストサンプルです。パフォーマンステストのために使用されます。"
             large_subtitles.append(SubtitleItem(i + 1, start_ms, end_ms, text))
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False, encoding="utf-8"
-        ) as f:
-            csv_path = Path(f.name)
-
-        try:
+        with managed_tmp(".csv") as csv_path:
             # エクスポート時間を測定
             start_time = time.time()
             exporter = SubtitleCSVExporter()
@@ -245,18 +217,9 @@ class TestCSVExportImportIntegration:
             file_size = csv_path.stat().st_size
             assert file_size > 0, "大容量ファイルが作成されていない"
 
-        finally:
-            if csv_path.exists():
-                csv_path.unlink()
-
     def test_gas_compatible_format(self, sample_subtitles_japanese):
         """Google Apps Script互換フォーマットのテスト"""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False, encoding="utf-8"
-        ) as f:
-            csv_path = Path(f.name)
-
-        try:
+        with managed_tmp(".csv") as csv_path:
             # GAS互換形式でエクスポート
             exporter = SubtitleCSVExporter()
             success = exporter.export_for_translation(
@@ -285,22 +248,13 @@ class TestCSVExportImportIntegration:
             # データ行の確認
             assert len(lines) >= 6, "期待されるデータ行数が不足"  # ヘッダー + 5つの字幕
 
-        finally:
-            if csv_path.exists():
-                csv_path.unlink()
-
     def test_batch_translation_workflow(self, sample_subtitles_japanese):
         """バッチ翻訳ワークフローのテスト"""
-        export_path = None
-        import_path = None
-
-        try:
+        with (
+            managed_tmp("_export.csv") as export_path,
+            managed_tmp("_translated.csv") as import_path,
+        ):
             # Step 1: 翻訳用CSVをエクスポート
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix="_export.csv", delete=False, encoding="utf-8"
-            ) as f:
-                export_path = Path(f.name)
-
             exporter = SubtitleCSVExporter()
             export_success = exporter.export_for_translation(
                 subtitles=sample_subtitles_japanese, filepath=export_path
@@ -309,39 +263,33 @@ class TestCSVExportImportIntegration:
             assert export_success, "バッチ翻訳用エクスポートに失敗"
 
             # Step 2: 翻訳済みCSVをシミュレート（手動で作成）
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix="_translated.csv", delete=False, encoding="utf-8", newline=""
-            ) as f:
-                import_path = Path(f.name)
-                writer = csv.writer(f)
-
-                # ヘッダー
-                writer.writerow(
-                    ["Index", "Start Time", "End Time", "Original Text", "Translated Text"]
+            # ヘッダー
+            rows = [["Index", "Start Time", "End Time", "Original Text", "Translated Text"]]
+
+            # 翻訳データ
+            translations = [
+                "Hello, World!",
+                "This is a test.\\nMultiple lines of text.",
+                "Last subtitle",
+                "",
+                "Special chars: @#$%^&*()",
+            ]
+
+            for i, subtitle in enumerate(sample_subtitles_japanese):
+                start_time = f"{subtitle.start_ms // 3600000:02d}:{(subtitle.start_ms % 3600000) // 60000:02d}:{(subtitle.start_ms % 60000) // 1000:02d},{subtitle.start_ms % 1000:03d}"
+                end_time = f"{subtitle.end_ms // 3600000:02d}:{(subtitle.end_ms % 3600000) // 60000:02d}:{(subtitle.end_ms % 60000) // 1000:02d},{subtitle.end_ms % 1000:03d}"
+
+                rows.append(
+                    [
+                        subtitle.index,
+                        start_time,
+                        end_time,
+                        subtitle.text.replace("\n", "\\n"),
+                        translations[i],
+                    ]
                 )
 
-                # 翻訳データ
-                translations = [
-                    "Hello, World!",
-                    "This is a test.\\nMultiple lines of text.",
-                    "Last subtitle",
-                    "",
-                    "Special chars: @#$%^&*()",
-                ]
-
-                for i, subtitle in enumerate(sample_subtitles_japanese):
-                    start_time = f"{subtitle.start_ms // 3600000:02d}:{(subtitle.start_ms % 3600000) // 60000:02d}:{(subtitle.start_ms % 60000) // 1000:02d},{subtitle.start_ms % 1000:03d}"
-                    end_time = f"{subtitle.end_ms // 3600000:02d}:{(subtitle.end_ms % 3600000) // 60000:02d}:{(subtitle.end_ms % 60000) // 1000:02d},{subtitle.end_ms % 1000:03d}"
-
-                    writer.writerow(
-                        [
-                            subtitle.index,
-                            start_time,
-                            end_time,
-                            subtitle.text.replace("\n", "\\n"),
-                            translations[i],
-                        ]
-                    )
+            _write_csv_rows(import_path, rows)
 
             # Step 3: 翻訳済みCSVをインポート
             importer = SubtitleCSVImporter()
@@ -360,9 +308,3 @@ class TestCSVExportImportIntegration:
                     assert (
                         "This is a test." in result.subtitles[1].text
                     ), "2番目の翻訳（複数行）が正しくない"
-
-        finally:
-            # クリーンアップ
-            for path in [export_path, import_path]:
-                if path and path.exists():
-                    path.unlink()
@@ -4,13 +4,10 @@
 Issue #112の対応
 """
 
-import sys
-from pathlib import Path
+import pytest
 
-# プロジェクトルートをPythonパスに追加
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
-from app.core.extractor.group import ExtractionProcessor
+import app.core.extractor.group as group_module
+from app.core.extractor.group import ExtractionProcessor, TextSimilarityCalculator
 from app.core.models import SubtitleItem
 
 
@@ -182,6 +179,39 @@ def test_exact_duplicate():
         return False
 
 
+# 編集距離の確認用ケース（文字列1, 文字列2, 期待される距離）
+EDIT_DISTANCE_CASES = [
+    ("シャワー", "シヤワー", 1),
+    ("帰宅しました", "帰宅した", 2),
+    ("", "テキスト", 4),
+    ("", "", 0),
+    ("kitten", "sitting", 3),
+    ("汗だくで帰宅しました", "汗だくで帰宅", 4),
+]
+
+
+def test_edit_distance_without_rapidfuzz(monkeypatch):
+    """rapidfuzz が無い環境でも同じ編集距離になるかのテスト"""
+    monkeypatch.setattr(group_module, "RAPIDFUZZ_AVAILABLE", False)
+
+    for s1, s2, expected in EDIT_DISTANCE_CASES:
+        assert TextSimilarityCalculator._calculate_edit_distance(s1, s2) == expected
+        assert TextSimilarityCalculator._calculate_edit_distance(s2, s1) == expected
+
+
+def test_edit_distance_backends_agree(monkeypatch):
+    """rapidfuzz と純Python実装で同じ編集距離になるかのテスト"""
+    pytest.importorskip("rapidfuzz")
+
+    for s1, s2, expected in EDIT_DISTANCE_CASES:
+        monkeypatch.setattr(group_module, "RAPIDFUZZ_AVAILABLE", True)
+        rapidfuzz_distance = TextSimilarityCalculator._calculate_edit_distance(s1, s2)
+        monkeypatch.setattr(group_module, "RAPIDFUZZ_AVAILABLE", False)
+        python_distance = TextSimilarityCalculator._calculate_edit_distance(s1, s2)
+
+        assert rapidfuzz_distance == python_distance == expected
+
+
 if __name__ == "__main__":
     print("重複字幕統合機能のテスト開始...\n")
 
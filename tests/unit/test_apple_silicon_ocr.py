@@ -5,7 +5,6 @@ added to address Issue #128 - macOS Apple Silicon PaddleOCR freeze problem.
 """
 
 import os
-import platform
 import queue
 import unittest
 from unittest.mock import Mock, patch
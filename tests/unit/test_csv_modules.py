@@ -5,8 +5,6 @@ CSVモジュールのテスト
 import csv
 from pathlib import Path
 
-import pytest
-
 from app.core.csv.exporter import (
     CSVExportSettings,
     SubtitleCSVExporter,
@@ -17,7 +15,6 @@ from app.core.csv.importer import (
     SubtitleCSVImporter,
     TranslationImportResult,
 )
-from app.core.models import SubtitleItem
 
 
 class TestCSVExportSettings:
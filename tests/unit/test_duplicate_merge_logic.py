@@ -4,16 +4,12 @@
 Issue #112の対応
 """
 
-import sys
+import operator
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
-# プロジェクトルートをPythonパスに追加
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockSubtitleItem:
     """SubtitleItem のモック"""
 
@@ -45,9 +41,8 @@ class MockTextSimilarityCalculator:
         if norm_text1 == norm_text2:
             return 1.0
 
-        # 長さが大きく異なる場合は類似度を下げる
-        len_ratio = min(len(norm_text1), len(norm_text2)) / max(len(norm_text1), len(norm_text2))
-        if len_ratio < 0.9:
+        # 長さが大きく異なる場合は類似度を下げる（min / max < 0.9 を整数演算で判定）
+        if min(len(norm_text1), len(norm_text2)) * 10 < max(len(norm_text1), len(norm_text2)) * 9:
             return 0.0
 
         # 文字レベルの類似度（厳密版）
@@ -55,8 +50,8 @@ class MockTextSimilarityCalculator:
             return 0.0
 
         # 完全に位置が一致する文字数 / 全文字数
-        min_len = min(len(norm_text1), len(norm_text2))
-        common_chars = sum(1 for i in range(min_len) if norm_text1[i] == norm_text2[i])
+        # map は短い方の長さで止まるため、先頭から短い方の文字数分の位置一致数になる
+        common_chars = sum(map(operator.eq, norm_text1, norm_text2))
         max_len = max(len(norm_text1), len(norm_text2))
 
         # 位置一致の類似度
@@ -4,347 +4,279 @@
 ファイル処理、権限、ディスク容量、ネットワーク等のエラーケースのテスト
 """
 
+import contextlib
 import os
-import shutil
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import mock_open, patch
 
 import pytest
 
 from app.core.csv.exporter import SubtitleCSVExporter
-from app.core.csv.importer import SubtitleCSVImporter
-from app.core.error_handler import ErrorHandler
 from app.core.extractor.sampler import VideoSampler
-from app.core.format.srt import SRTFormatter, SRTParser
 from app.core.models import SubtitleItem
-from app.core.project_manager import ProjectManager
 
 
-class TestFilePermissionErrors:
-    """ファイル権限エラーのテスト"""
+def _generate_subtitles(count):
+    """テスト用字幕を逐次生成"""
+    for i in range(count):
+        yield SubtitleItem(i + 1, i * 1000, (i + 1) * 1000, f"字幕{i}: 長いテキスト")
 
-    def test_read_permission_denied(self):
-        """読み込み権限なしファイルのテスト"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".srt", delete=False) as f:
-            srt_path = Path(f.name)
-            f.write("1\n00:00:01,000 --> 00:00:03,000\nテスト字幕\n\n")
 
-        try:
-            # ファイルを読み取り専用にする（Windowsでは効果が限定的）
-            os.chmod(str(srt_path), 0o000)
+# chmod による権限制限が効くのは非rootのPOSIX環境のみ
+_CHMOD_EFFECTIVE = os.name == "posix" and os.geteuid() != 0
 
-            parser = SRTParser()
+requires_chmod = pytest.mark.skipif(
+    not _CHMOD_EFFECTIVE, reason="chmod semantics require non-root POSIX"
+)
 
-            # 権限エラーが適切に処理されることを確認
-            with pytest.raises((PermissionError, OSError)):
-                parser.parse_srt_file(srt_path)
 
-        except OSError:
-            # OS によっては権限変更できない場合がある
-            pytest.skip("権限変更がサポートされていない")
-
-        finally:
-            # クリーンアップ時に権限を復元
-            try:
-                os.chmod(str(srt_path), 0o666)
-                srt_path.unlink()
-            except (OSError, PermissionError):
-                pass
-
-    def test_write_permission_denied(self):
-        """書き込み権限なしディレクトリのテスト"""
-        # 一時ディレクトリを作成
-        temp_dir = Path(tempfile.mkdtemp())
+@pytest.fixture
+def chmod_path():
+    """パスの権限を変更し、テスト終了時に tmp_path を削除できる権限へ戻す"""
+    changed = []
 
-        try:
-            # ディレクトリを読み取り専用にする
-            os.chmod(str(temp_dir), 0o555)
+    def _chmod(path: Path, mode: int) -> Path:
+        os.chmod(path, mode)
+        changed.append(path)
+        return path
 
-            srt_path = temp_dir / "test.srt"
-            test_subtitles = [SubtitleItem(1, 1000, 3000, "テスト")]
+    yield _chmod
 
-            writer = SRTFormatter()
+    for path in changed:
+        os.chmod(path, 0o755 if path.is_dir() else 0o666)
 
-            # 書き込み権限エラーが適切に処理されることを確認
-            with pytest.raises((PermissionError, OSError)):
-                writer.save_srt_file(test_subtitles, srt_path)
 
-        except OSError:
-            pytest.skip("権限変更がサポートされていない")
+@pytest.fixture
+def make_corrupt_file(tmp_path):
+    """指定した内容・拡張子の破損ファイルを tmp_path に作成するファクトリ"""
 
-        finally:
-            # クリーンアップ
-            try:
-                os.chmod(str(temp_dir), 0o755)
-                shutil.rmtree(str(temp_dir))
-            except (OSError, PermissionError):
-                pass
+    def _make(content: bytes, suffix: str) -> Path:
+        path = tmp_path / f"corrupt{suffix}"
+        path.write_bytes(content)
+        return path
 
-    def test_readonly_file_overwrite_attempt(self):
-        """読み取り専用ファイルの上書き試行テスト"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".srt", delete=False) as f:
-            srt_path = Path(f.name)
-            f.write("元のデータ")
+    return _make
 
-        try:
-            # ファイルを読み取り専用にする
-            os.chmod(str(srt_path), 0o444)
 
-            test_subtitles = [SubtitleItem(1, 1000, 3000, "新しいデータ")]
-            writer = SRTFormatter()
+@requires_chmod
+class TestFilePermissionErrors:
+    """ファイル権限エラーのテスト"""
+
+    def test_read_permission_denied(self, tmp_path, srt_parser, chmod_path):
+        """読み込み権限なしファイルのテスト"""
+        srt_path = tmp_path / "test.srt"
+        srt_path.write_text("1\n00:00:01,000 --> 00:00:03,000\nテスト字幕\n\n", encoding="utf-8")
+        chmod_path(srt_path, 0o000)
 
-            # 読み取り専用ファイルの上書きでエラーが発生することを確認
-            with pytest.raises((PermissionError, OSError)):
-                writer.save_srt_file(test_subtitles, srt_path)
+        # 権限エラーが適切に処理されることを確認
+        with pytest.raises((PermissionError, OSError)):
+            srt_parser.parse_srt_file(srt_path)
 
-        except OSError:
-            pytest.skip("権限変更がサポートされていない")
+    def test_write_permission_denied(self, tmp_path, srt_formatter, chmod_path, single_subtitle):
+        """書き込み権限なしディレクトリのテスト"""
+        # tmp_path 自体ではなく子ディレクトリを読み取り専用にする
+        readonly_dir = tmp_path / "readonly"
+        readonly_dir.mkdir()
+        chmod_path(readonly_dir, 0o555)
 
-        finally:
-            try:
-                os.chmod(str(srt_path), 0o666)
-                srt_path.unlink()
-            except (OSError, PermissionError):
-                pass
+        srt_path = readonly_dir / "test.srt"
+
+        # 書き込み権限エラーが適切に処理されることを確認
+        with pytest.raises((PermissionError, OSError)):
+            srt_formatter.save_srt_file(single_subtitle, srt_path)
+
+    def test_readonly_file_overwrite_attempt(self, tmp_path, srt_formatter, chmod_path):
+        """読み取り専用ファイルの上書き試行テスト"""
+        srt_path = tmp_path / "test.srt"
+        srt_path.write_text("元のデータ", encoding="utf-8")
+        chmod_path(srt_path, 0o444)
+
+        test_subtitles = [SubtitleItem(1, 1000, 3000, "新しいデータ")]
+
+        # 読み取り専用ファイルの上書きでエラーが発生することを確認
+        with pytest.raises((PermissionError, OSError)):
+            srt_formatter.save_srt_file(test_subtitles, srt_path)
 
 
 class TestDiskSpaceErrors:
     """ディスク容量エラーのテスト"""
 
-    @patch("builtins.open")
-    def test_disk_full_simulation(self, mock_open):
+    @patch("app.core.format.srt.open", new_callable=mock_open, create=True)
+    def test_disk_full_simulation(self, mocked_open, srt_formatter, single_subtitle):
         """ディスク容量不足のシミュレーションテスト"""
         # ディスク容量不足エラーをシミュレート
-        mock_file = Mock()
-        mock_file.write.side_effect = OSError(28, "No space left on device")
-        mock_open.return_value.__enter__.return_value = mock_file
-
-        test_subtitles = [SubtitleItem(1, 1000, 3000, "テスト")]
-        writer = SRTFormatter()
+        mocked_open.return_value.write.side_effect = OSError(28, "No space left on device")
 
         # ディスク容量不足エラーが適切に処理されることを確認
         with pytest.raises(OSError):
-            writer.save_srt_file(test_subtitles, Path("/tmp/test.srt"))
-
-    def test_large_file_creation_failure(self):
+            srt_formatter.save_srt_file(single_subtitle, Path("/tmp/test.srt"))
+
+    @pytest.mark.parametrize(
+        "count, repeat",
+        [
+            (1000, 10),
+            pytest.param(100000, 100, marks=pytest.mark.slow),  # 10万項目
+        ],
+    )
+    def test_large_file_creation_failure(self, tmp_path, count, repeat, srt_formatter):
         """大容量ファイル作成失敗のテスト"""
-        # 非常に大量の字幕データを生成
-        huge_subtitles = []
-        for i in range(100000):  # 10万項目
-            text = "非常に長いテキスト" * 100  # 長いテキスト
-            huge_subtitles.append(SubtitleItem(i + 1, i * 1000, (i + 1) * 1000, text))
+        # 大量の字幕データを生成
+        text = "非常に長いテキスト" * repeat  # 長いテキスト
+        huge_subtitles = [SubtitleItem(i + 1, i * 1000, (i + 1) * 1000, text) for i in range(count)]
 
-        with tempfile.NamedTemporaryFile(suffix=".srt", delete=False) as f:
-            srt_path = Path(f.name)
+        srt_path = tmp_path / "huge.srt"
 
-        try:
-            writer = SRTFormatter()
-
-            # 大容量ファイルの作成を試行（システムの制限に依存）
-            # メモリ不足やディスク容量不足が発生する可能性
-            try:
-                writer.save_srt_file(huge_subtitles, srt_path)
-                # 成功した場合、ファイルサイズを確認
-                if srt_path.exists():
-                    file_size = srt_path.stat().st_size
-                    assert file_size > 1000000, "大容量ファイルが作成されていない"
-            except (MemoryError, OSError) as e:
-                # メモリ不足やディスク容量不足は期待される動作
-                assert True, f"期待されるエラー: {e}"
-
-        finally:
+        # 大容量ファイルの作成を試行（システムの制限に依存）
+        # メモリ不足やディスク容量不足は期待される動作
+        with contextlib.suppress(MemoryError, OSError):
+            srt_formatter.save_srt_file(huge_subtitles, srt_path)
+            # 成功した場合、ファイルサイズを確認（1項目あたり100バイト以上）
             if srt_path.exists():
-                srt_path.unlink()
+                file_size = srt_path.stat().st_size
+                assert file_size > count * 100, "大容量ファイルが作成されていない"
 
 
 class TestCorruptedFileHandling:
     """破損ファイル処理のテスト"""
 
-    def test_corrupted_video_file(self):
+    def test_corrupted_video_file(self, make_corrupt_file):
         """破損動画ファイルの処理テスト"""
         # 不正な動画ファイルを作成
-        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
-            corrupted_path = Path(f.name)
-            f.write(b"This is not a video file content")
+        corrupted_path = make_corrupt_file(b"This is not a video file content", ".mp4")
 
-        try:
-            sampler = VideoSampler(str(corrupted_path), sample_fps=1.0)
-
-            # 破損動画ファイルの処理でエラーが適切に処理されることを確認
-            with pytest.raises(Exception):
-                list(sampler.sample_frames())
+        # 破損動画ファイルはオープン時点（コンストラクタ）で失敗すること
+        with pytest.raises(RuntimeError, match="動画ファイルを開けませんでした"):
+            VideoSampler(str(corrupted_path), sample_fps=1.0)
 
-        finally:
-            if corrupted_path.exists():
-                corrupted_path.unlink()
-
-    def test_truncated_srt_file(self):
-        """切り詰められたSRTファイルの処理テスト"""
-        # 不完全なSRTファイルを作成
-        truncated_contents = [
+    @pytest.mark.parametrize(
+        "content",
+        [
             "1\n00:00:01,000 --> 00:00:03,000\n字幕1\n\n2\n00:00:04,000",  # 途中で切れている
             "1\n00:00:01,000",  # タイムコードが不完全
             "1\n00:00:01,000 --> 00:00:03,000",  # テキストがない
-        ]
-
-        for i, content in enumerate(truncated_contents):
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".srt", delete=False, encoding="utf-8"
-            ) as f:
-                srt_path = Path(f.name)
-                f.write(content)
-
-            try:
-                reader = SRTParser()
-
-                # 不完全ファイルでもエラーハンドリングが働くことを確認
-                try:
-                    subtitles = reader.parse_srt_file(srt_path)
-                    # 読み込めた場合は、部分的にでもデータが取得できることを確認
-                    assert isinstance(subtitles, list), "部分的読み込みでもリストが返される"
-                except Exception:
-                    # エラーが発生することも期待される動作
-                    assert True, "不完全ファイルでエラーが発生"
-
-            finally:
-                if srt_path.exists():
-                    srt_path.unlink()
-
-    def test_binary_data_in_text_file(self):
-        """テキストファイルにバイナリデータが含まれる場合のテスト"""
-        # バイナリデータを含むファイルを作成
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".srt", delete=False) as f:
-            binary_path = Path(f.name)
-            # 正常なテキストとバイナリデータを混在
-            f.write(b"1\n00:00:01,000 --> 00:00:03,000\n")
-            f.write(b"\x00\x01\x02\x03\xff\xfe")  # バイナリデータ
-            f.write(b"\n\n2\n00:00:04,000 --> 00:00:06,000\n\xe6\x97\xa5\xe6\x9c\xac\xe8\xaa\x9e")
+        ],
+    )
+    def test_truncated_srt_file(self, make_corrupt_file, srt_parser, content):
+        """切り詰められたSRTファイルの処理テスト"""
+        # 不完全なSRTファイルを作成
+        srt_path = make_corrupt_file(content.encode("utf-8"), ".srt")
 
-        try:
-            reader = SRTParser()
+        # 不完全ファイルでもエラーハンドリングが働くことを確認
+        # （解析・読み込みエラーの送出も期待される動作）
+        with contextlib.suppress(ValueError, OSError):
+            subtitles = srt_parser.parse_srt_file(srt_path)
+            # 読み込めた場合は、部分的にでもデータが取得できることを確認
+            assert isinstance(subtitles, list), "部分的読み込みでもリストが返される"
+
+    def test_binary_data_in_text_file(self, make_corrupt_file, srt_parser):
+        """テキストファイルにバイナリデータが含まれる場合のテスト"""
+        # 正常なテキストとバイナリデータを混在させたファイルを作成
+        binary_path = make_corrupt_file(
+            b"1\n00:00:01,000 --> 00:00:03,000\n"
+            b"\x00\x01\x02\x03\xff\xfe"  # バイナリデータ
+            b"\n\n2\n00:00:04,000 --> 00:00:06,000\n\xe6\x97\xa5\xe6\x9c\xac\xe8\xaa\x9e",
+            ".srt",
+        )
 
-            # バイナリデータを含むファイルでもエラーハンドリングが働くことを確認
-            with pytest.raises((UnicodeDecodeError, Exception)):
-                reader.parse_srt_file(binary_path)
+        # parse_srt_file は例外を送出せず、UTF-8で読めない場合は代替エンコーディングで読み込む
+        subtitles = srt_parser.parse_srt_file(binary_path)
 
-        finally:
-            if binary_path.exists():
-                binary_path.unlink()
+        # バイナリ部分があってもタイムコードは正しく解析されること
+        assert [(s.start_ms, s.end_ms) for s in subtitles] == [(1000, 3000), (4000, 6000)]
 
 
 class TestNetworkAndIOErrors:
     """ネットワークとI/Oエラーのテスト"""
 
     @patch("pathlib.Path.exists")
-    def test_file_disappeared_during_operation(self, mock_exists):
+    def test_file_disappeared_during_operation(self, mock_exists, srt_parser):
         """操作中にファイルが消失する場合のテスト"""
         # ファイルが存在すると最初は答えるが、実際のアクセス時には存在しない
         mock_exists.return_value = True
 
-        reader = SRTParser()
-
         # 存在しないファイルへのアクセスでエラーが適切に処理されることを確認
         with pytest.raises(FileNotFoundError):
-            reader.parse_srt_file(Path("nonexistent_file.srt"))
+            srt_parser.parse_srt_file(Path("nonexistent_file.srt"))
 
-    def test_device_disconnection_simulation(self):
-        """デバイス切断シミュレーションテスト"""
-        # ネットワークドライブや取り外し可能メディアの切断をシミュレート
-        invalid_paths = [
+    @pytest.mark.parametrize(
+        "invalid_path",
+        [
             "/media/nonexistent_device/file.srt",
             "//invalid_network_share/file.srt",
             "Z:\\nonexistent_drive\\file.srt",
-        ]
-
-        for invalid_path in invalid_paths:
-            try:
-                reader = SRTParser()
-
-                # デバイス切断時のエラーが適切に処理されることを確認
-                with pytest.raises((FileNotFoundError, OSError)):
-                    reader.parse_srt_file(invalid_path)
+        ],
+    )
+    def test_device_disconnection_simulation(self, srt_parser, invalid_path):
+        """デバイス切断シミュレーションテスト"""
+        # ネットワークドライブや取り外し可能メディアの切断をシミュレート
+        try:
+            # デバイス切断時のエラーが適切に処理されることを確認
+            with pytest.raises((FileNotFoundError, OSError)):
+                srt_parser.parse_srt_file(invalid_path)
 
-            except OSError:
-                # OSによってはパス形式自体がサポートされていない場合
-                continue
+        except OSError:
+            # OSによってはパス形式自体がサポートされていない場合
+            pytest.skip("パス形式がサポートされていない")
 
-    @patch("builtins.open")
-    def test_io_interrupt_during_read(self, mock_open):
+    @patch("app.core.format.srt.open", new_callable=mock_open, create=True)
+    def test_io_interrupt_during_read(self, mocked_open, srt_parser):
         """読み込み中のI/O割り込みテスト"""
         # I/O割り込みエラーをシミュレート
-        mock_file = Mock()
-        mock_file.read.side_effect = IOError("I/O operation interrupted")
-        mock_open.return_value.__enter__.return_value = mock_file
-
-        reader = SRTParser()
+        mocked_open.return_value.read.side_effect = IOError("I/O operation interrupted")
 
         # I/O割り込みエラーが適切に処理されることを確認
         with pytest.raises(IOError):
-            reader.parse_srt_file(Path("test.srt"))
+            srt_parser.parse_srt_file(Path("test.srt"))
 
-    @patch("builtins.open")
-    def test_io_interrupt_during_write(self, mock_open):
+    @patch("app.core.format.srt.open", new_callable=mock_open, create=True)
+    def test_io_interrupt_during_write(self, mocked_open, srt_formatter, single_subtitle):
         """書き込み中のI/O割り込みテスト"""
         # I/O割り込みエラーをシミュレート
-        mock_file = Mock()
-        mock_file.write.side_effect = IOError("I/O operation interrupted")
-        mock_open.return_value.__enter__.return_value = mock_file
-
-        test_subtitles = [SubtitleItem(1, 1000, 3000, "テスト")]
-        writer = SRTFormatter()
+        mocked_open.return_value.write.side_effect = IOError("I/O operation interrupted")
 
         # I/O割り込みエラーが適切に処理されることを確認
         with pytest.raises(IOError):
-            writer.save_srt_file(test_subtitles, Path("test.srt"))
+            srt_formatter.save_srt_file(single_subtitle, Path("test.srt"))
 
 
 class TestMemoryErrors:
     """メモリエラーのテスト"""
 
     @patch("app.core.format.srt.SRTFormatter.save_srt_file")
-    def test_memory_exhaustion_during_write(self, mock_write):
+    def test_memory_exhaustion_during_write(self, mock_write, srt_formatter, single_subtitle):
         """書き込み中のメモリ不足テスト"""
         # メモリ不足エラーをシミュレート
         mock_write.side_effect = MemoryError("Out of memory")
 
-        test_subtitles = [SubtitleItem(1, 1000, 3000, "テスト")]
-        writer = SRTFormatter()
-
         # メモリ不足エラーが適切に処理されることを確認
         with pytest.raises(MemoryError):
-            writer.save_srt_file(test_subtitles, Path("test.srt"))
-
-    def test_large_subtitle_list_handling(self):
+            srt_formatter.save_srt_file(single_subtitle, Path("test.srt"))
+
+    @pytest.mark.parametrize(
+        "count",
+        [
+            5000,
+            pytest.param(50000, marks=pytest.mark.slow),  # 5万項目
+        ],
+    )
+    def test_large_subtitle_list_handling(self, tmp_path, count):
         """大量字幕リストの処理テスト"""
         try:
-            # 大量の字幕データを生成（メモリ使用量を監視）
-            large_subtitles = []
-            for i in range(50000):  # 5万項目
-                text = f"字幕{i}: " + "長いテキスト" * 10
-                large_subtitles.append(SubtitleItem(i + 1, i * 1000, (i + 1) * 1000, text))
-
-            # メモリ効率的に処理されることを確認
-            assert len(large_subtitles) == 50000, "大量データの生成に失敗"
+            # 大量の字幕データを生成（エクスポーターがlen()を使うためリスト化）
+            large_subtitles = list(_generate_subtitles(count))
 
             # CSVエクスポートでのメモリ効率をテスト
-            with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
-                csv_path = Path(f.name)
-
-            try:
-                exporter = SubtitleCSVExporter()
-                # メモリ不足にならずに完了することを確認
-                exporter.export_for_translation(
-                    subtitles=large_subtitles,
-                    filepath=csv_path,
-                    source_lang="ja",
-                )
+            csv_path = tmp_path / "large.csv"
+            exporter = SubtitleCSVExporter()
 
-                assert csv_path.exists(), "大量データのCSVエクスポートに失敗"
+            # メモリ不足にならずに完了することを確認
+            assert exporter.export_for_translation(
+                subtitles=large_subtitles,
+                filepath=csv_path,
+                source_lang="ja",
+            ), "大量データのCSVエクスポートに失敗"
 
-            finally:
-                if csv_path.exists():
-                    csv_path.unlink()
+            assert csv_path.stat().st_size > 0, "大量データのCSVが空"
 
         except MemoryError:
             pytest.skip("システムメモリが不足")
@@ -353,113 +285,80 @@ class TestMemoryErrors:
 class TestErrorHandlerIntegration:
     """エラーハンドラー統合テスト"""
 
-    def test_error_handler_initialization(self):
+    def test_error_handler_initialization(self, error_handler):
         """エラーハンドラーの初期化テスト"""
-        handler = ErrorHandler()
-
         # 基本的な初期化が正しく行われることを確認
-        assert hasattr(handler, "handle_error"), "handle_errorメソッドが存在しない"
-        assert hasattr(handler, "log_error"), "log_errorメソッドが存在しない"
+        assert hasattr(error_handler, "handle_error"), "handle_errorメソッドが存在しない"
+        assert hasattr(error_handler, "log_error"), "log_errorメソッドが存在しない"
 
-    def test_error_logging_functionality(self):
+    def test_error_logging_functionality(self, error_handler):
         """エラーログ機能のテスト"""
-        handler = ErrorHandler()
-
         # テストエラーをログに記録
         test_error = ValueError("テストエラー")
         context = {"operation": "test_operation", "file": "test.srt"}
 
         try:
-            handler.log_error(test_error, context)
+            error_handler.log_error(test_error, context)
             # エラーログが正常に記録されることを確認
             assert True, "エラーログが正常に記録された"
         except Exception as e:
             pytest.fail(f"エラーログの記録に失敗: {e}")
 
-    def test_error_recovery_mechanisms(self):
-        """エラー回復メカニズムのテスト"""
-        handler = ErrorHandler()
-
-        # 回復可能エラーのテスト
-        recoverable_errors = [
+    @pytest.mark.parametrize(
+        "error",
+        [
             FileNotFoundError("ファイルが見つからない"),
             PermissionError("権限がない"),
             IOError("I/Oエラー"),
-        ]
-
-        for error in recoverable_errors:
-            try:
-                recovery_result = handler.attempt_recovery(error)
-                # 回復試行が実行されることを確認
-                assert isinstance(recovery_result, bool), "回復試行の結果がブール値でない"
-            except Exception as e:
-                pytest.fail(f"エラー回復メカニズムの実行に失敗: {e}")
-
-    def test_critical_error_handling(self):
-        """致命的エラーの処理テスト"""
-        handler = ErrorHandler()
-
-        # 致命的エラーのテスト
-        critical_errors = [
+        ],
+        ids=["file_not_found", "permission", "io"],
+    )
+    def test_error_recovery_mechanisms(self, error_handler, error):
+        """エラー回復メカニズムのテスト（回復可能エラー）"""
+        recovery_result = error_handler.attempt_recovery(error)
+
+        # 回復試行が実行されることを確認
+        assert isinstance(recovery_result, bool), "回復試行の結果がブール値でない"
+
+    @pytest.mark.parametrize(
+        "error",
+        [
             MemoryError("メモリ不足"),
             SystemError("システムエラー"),
             KeyboardInterrupt("ユーザー割り込み"),
-        ]
+        ],
+        ids=["memory", "system", "keyboard_interrupt"],
+    )
+    def test_critical_error_handling(self, error_handler, error):
+        """致命的エラーの処理テスト"""
+        result = error_handler.handle_critical_error(error)
 
-        for error in critical_errors:
-            try:
-                result = handler.handle_critical_error(error)
-                # 致命的エラーが適切に処理されることを確認
-                assert result is not None, "致命的エラーの処理結果がない"
-            except Exception as e:
-                pytest.fail(f"致命的エラーの処理に失敗: {e}")
+        # 致命的エラーが適切に処理されることを確認
+        assert result is not None, "致命的エラーの処理結果がない"
 
 
 class TestProjectManagerErrorHandling:
     """プロジェクトマネージャーのエラーハンドリングテスト"""
 
-    def test_invalid_project_file_handling(self):
+    def test_invalid_project_file_handling(self, tmp_path, project_manager):
         """無効なプロジェクトファイルの処理テスト"""
         # 無効なJSON形式のプロジェクトファイルを作成
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".subproj", delete=False, encoding="utf-8"
-        ) as f:
-            project_path = Path(f.name)
-            f.write("{ invalid json content }")
-
-        try:
-            manager = ProjectManager()
+        project_path = tmp_path / "invalid.subproj"
+        project_path.write_text("{ invalid json content }", encoding="utf-8")
 
-            # 無効なプロジェクトファイルの読み込みでエラーが適切に処理されることを確認
-            with pytest.raises(Exception):
-                manager.load_project(str(project_path))
+        # 無効なプロジェクトファイルの読み込みでエラーが適切に処理されることを確認
+        with pytest.raises((ValueError, RuntimeError)):
+            project_manager.load_project(project_path)
 
-        finally:
-            if project_path.exists():
-                project_path.unlink()
-
-    def test_corrupted_project_data_recovery(self):
+    def test_corrupted_project_data_recovery(self, tmp_path, project_manager):
         """破損プロジェクトデータの回復テスト"""
-        # 部分的に破損したプロジェクトファイルを作成
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".subproj", delete=False, encoding="utf-8"
-        ) as f:
-            project_path = Path(f.name)
-            # 一部のフィールドが欠けているJSON
-            f.write('{"version": "1.0", "subtitles": []}')  # 他の必要フィールドが欠けている
-
-        try:
-            manager = ProjectManager()
-
-            # 部分的破損ファイルでも可能な限り回復されることを確認
-            try:
-                project_data = manager.load_project(str(project_path))
-                # 部分的にでもデータが読み込めることを確認
-                assert "subtitles" in project_data, "部分的データの読み込みに失敗"
-            except Exception:
-                # 回復不可能な場合はエラーが発生することも期待される
-                assert True, "回復不可能な破損ファイルでエラーが発生"
-
-        finally:
-            if project_path.exists():
-                project_path.unlink()
+        # 一部のフィールドが欠けているJSON（他の必要フィールドが欠けている）
+        project_path = tmp_path / "corrupted.subproj"
+        project_path.write_text('{"version": "1.0", "subtitles": []}', encoding="utf-8")
+
+        # 部分的破損ファイルでも可能な限り回復されることを確認
+        # （回復不可能な場合は形式エラーが発生することも期待される）
+        with contextlib.suppress(ValueError, RuntimeError):
+            project_data = project_manager.load_project(project_path)
+            # 部分的にでもデータが読み込めることを確認
+            assert isinstance(project_data.subtitles, list), "部分的データの読み込みに失敗"
@@ -4,69 +4,161 @@
 各種動画フォーマット、字幕フォーマット、文字エンコーディングの対応テスト
 """
 
-import tempfile
+import shutil
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
+from typing import Dict, Iterator, Tuple
 
 import cv2
 import numpy as np
 import pytest
 
 from app.core.extractor.sampler import VideoSampler
-from app.core.format.srt import SRTFormatter, SRTParser
 from app.core.models import SubtitleItem
 
+# 不正なSRTファイルの内容
+MALFORMED_SRT_CONTENTS = [
+    # タイムコードが不正
+    "1\n99:99:99,999 --> 00:00:03,000\n不正なタイムコード\n\n",
+    # 番号が不正
+    "abc\n00:00:01,000 --> 00:00:03,000\n不正な番号\n\n",
+    # フォーマットが不正
+    "1\n不正なフォーマット\nテキスト\n\n",
+]
+
+# ファイル名の扱いを検証するUnicodeファイル名
+UNICODE_FILENAMES = [
+    "日本語ファイル名.srt",
+    "файл_с_русским_именем.srt",
+    "archivo_español.srt",
+    "中文文件名.srt",
+    "한글파일명.srt",
+]
+
+# ファイル名の扱いを検証する特殊文字を含むファイル名
+SPECIAL_CHARACTER_FILENAMES = [
+    "file with spaces.srt",
+    "file-with-dashes.srt",
+    "file_with_underscores.srt",
+    "file.with.dots.srt",
+    "file(with)parentheses.srt",
+    "file[with]brackets.srt",
+]
+
+# 読み込みを検証する動画フォーマット (拡張子, コーデック)
+VIDEO_FORMAT_CASES = [
+    ("mp4", "mp4v"),
+    ("avi", "XVID"),
+    ("mov", "mp4v"),
+]
+
+
+def _write_test_video(video_path: Path, codec: str, duration_seconds: int) -> None:
+    """OpenCVでテスト用動画を書き出し"""
+    fourcc = cv2.VideoWriter_fourcc(*codec)
+    fps = 30
+    frame_count = duration_seconds * fps
+
+    # 黒背景に白文字のフレームを1枚だけ描画して使い回す（内容はテストで検証しない）
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    cv2.putText(frame, "0.0s", (250, 240), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+
+    out = cv2.VideoWriter(str(video_path), fourcc, fps, (640, 480))
+
+    # VideoWriter.write はエンコーダ側へコピーするため同じ配列を渡してよい
+    for _ in range(frame_count):
+        out.write(frame)
+
+    out.release()
+
+
+@contextmanager
+def _open_capture(video_path: Path) -> Iterator[cv2.VideoCapture]:
+    """VideoCapture を開き、アサーション失敗時も確実に解放する"""
+    cap = cv2.VideoCapture(str(video_path))
+    # メタデータ取得やシーク用途ではデコードバッファを最小にする
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    try:
+        yield cap
+    finally:
+        cap.release()
+
+
+@pytest.fixture(scope="session")
+def make_test_video(tmp_path_factory):
+    """テスト用動画ファイルを作成するファクトリ
+
+    同じ条件の動画はセッション内で使い回し、コーデックと長さが同じで
+    拡張子だけが異なる場合はエンコードせずにコピーする。
+    """
+    video_dir = tmp_path_factory.mktemp("videos")
+    encoded: Dict[Tuple[str, int], Path] = {}
+    created: Dict[Tuple[str, str, int], Path] = {}
+
+    def _make(format_ext: str, codec: str = "mp4v", duration_seconds: int = 3) -> Path:
+        key = (format_ext, codec, duration_seconds)
+        if key in created:
+            return created[key]
+
+        video_path = video_dir / f"{codec}_{duration_seconds}s.{format_ext}"
+        source = encoded.get((codec, duration_seconds))
+        if source is not None:
+            shutil.copyfile(source, video_path)
+        else:
+            _write_test_video(video_path, codec, duration_seconds)
+            encoded[(codec, duration_seconds)] = video_path
+
+        created[key] = video_path
+        return video_path
 
-class TestVideoFormatSupport:
-    """動画フォーマット対応テスト"""
+    return _make
 
-    def create_test_video(self, format_ext, codec="mp4v", duration_seconds=3):
-        """テスト用動画ファイルを作成"""
-        with tempfile.NamedTemporaryFile(suffix=f".{format_ext}", delete=False) as f:
-            video_path = Path(f.name)
 
-        # OpenCVで動画を作成
-        fourcc = cv2.VideoWriter_fourcc(*codec)
-        fps = 30
-        frame_count = duration_seconds * fps
+@pytest.fixture(scope="session")
+def supported_video_formats(tmp_path_factory):
+    """この環境で書き出し可能な (拡張子, コーデック) の組み合わせ"""
+    probe_dir = tmp_path_factory.mktemp("codec_probe")
+    supported = set()
 
-        out = cv2.VideoWriter(str(video_path), fourcc, fps, (640, 480))
+    for format_ext, codec in VIDEO_FORMAT_CASES:
+        out = cv2.VideoWriter(
+            str(probe_dir / f"probe_{codec}.{format_ext}"),
+            cv2.VideoWriter_fourcc(*codec),
+            30,
+            (640, 480),
+        )
+        if out.isOpened():
+            supported.add((format_ext, codec))
+        out.release()
 
-        for i in range(frame_count):
-            # 黒背景に白文字で時間を表示
-            frame = np.zeros((480, 640, 3), dtype=np.uint8)
-            time_text = f"{i/fps:.1f}s"
-            cv2.putText(
-                frame, time_text, (250, 240), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2
-            )
-            out.write(frame)
+    return supported
 
-        out.release()
-        return video_path
 
-    @pytest.mark.parametrize(
-        "format_ext,codec",
-        [
-            ("mp4", "mp4v"),
-            ("avi", "XVID"),
-            ("mov", "mp4v"),
-        ],
-    )
-    def test_video_format_reading(self, format_ext, codec):
+class TestVideoFormatSupport:
+    """動画フォーマット対応テスト"""
+
+    @pytest.mark.parametrize("format_ext,codec", VIDEO_FORMAT_CASES)
+    def test_video_format_reading(
+        self, make_test_video, supported_video_formats, format_ext, codec
+    ):
         """各種動画フォーマットの読み込みテスト"""
-        video_path = None
+        if (format_ext, codec) not in supported_video_formats:
+            pytest.skip(f"{format_ext}/{codec} のエンコーダが利用できない")
+
         try:
             # テスト動画を作成
-            video_path = self.create_test_video(format_ext, codec)
+            video_path = make_test_video(format_ext, codec)
 
             # VideoSamplerで読み込み
-            sampler = VideoSampler(str(video_path), sample_fps=1.0)
-            frames = list(sampler.sample_frames())
+            # 形式確認には先頭フレームだけあればよい
+            with VideoSampler(str(video_path), sample_fps=1.0) as sampler:
+                first_frame = next(islice(sampler.sample_frames(), 1), None)
 
             # フレームが正しく取得できることを確認
-            assert len(frames) > 0, f"{format_ext}形式の動画からフレームを取得できない"
+            assert first_frame is not None, f"{format_ext}形式の動画からフレームを取得できない"
 
             # フレームデータの形式確認
-            first_frame = frames[0]
             assert hasattr(first_frame, "frame"), "フレームデータが正しくない"
             assert hasattr(first_frame, "timestamp_ms"), "タイムスタンプが正しくない"
             assert first_frame.frame.shape == (480, 640, 3), "フレームサイズが正しくない"
@@ -74,72 +166,49 @@ class TestVideoFormatSupport:
         except Exception as e:
             pytest.skip(f"{format_ext}形式がサポートされていない: {e}")
 
-        finally:
-            if video_path and video_path.exists():
-                video_path.unlink()
-
-    def test_corrupted_video_handling(self):
+    def test_corrupted_video_handling(self, tmp_path):
         """破損した動画ファイルの処理テスト"""
         # 不正な動画ファイルを作成
-        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
-            corrupted_path = Path(f.name)
-            f.write(b"This is not a video file")
-
-        try:
-            sampler = VideoSampler(str(corrupted_path), sample_fps=1.0)
+        corrupted_path = tmp_path / "corrupted.mp4"
+        corrupted_path.write_bytes(b"This is not a video file")
 
-            # 破損ファイルの処理でエラーハンドリングが働くことを確認
-            with pytest.raises(Exception):
-                list(sampler.sample_frames())
+        sampler = VideoSampler(str(corrupted_path), sample_fps=1.0)
 
-        finally:
-            if corrupted_path.exists():
-                corrupted_path.unlink()
+        # 破損ファイルの処理でエラーハンドリングが働くことを確認
+        with pytest.raises(Exception):
+            list(sampler.sample_frames())
 
-    def test_very_large_video_handling(self):
+    def test_very_large_video_handling(self, make_test_video):
         """大容量動画ファイルの処理テスト"""
-        video_path = None
-        try:
-            # 長時間の動画を作成（10秒間）
-            video_path = self.create_test_video("mp4", "mp4v", duration_seconds=10)
-
-            sampler = VideoSampler(str(video_path), sample_fps=0.5)
-
-            # 低いサンプリングレートで処理
-            frames = list(sampler.sample_frames())
+        # 長時間の動画を作成（10秒間）
+        video_path = make_test_video("mp4", "mp4v", duration_seconds=10)
 
-            # メモリ効率的に処理されていることを確認
-            assert len(frames) == 5, "サンプリング数が正しくない"  # 10秒 × 0.5fps = 5フレーム
+        # 低いサンプリングレートで処理
+        # フレームを保持せず枚数だけ数える
+        with VideoSampler(str(video_path), sample_fps=0.5) as sampler:
+            frame_count = sum(1 for _ in sampler.sample_frames())
 
-        finally:
-            if video_path and video_path.exists():
-                video_path.unlink()
+        # メモリ効率的に処理されていることを確認
+        assert frame_count == 5, "サンプリング数が正しくない"  # 10秒 × 0.5fps = 5フレーム
 
-    def test_video_metadata_extraction(self):
+    def test_video_metadata_extraction(self, make_test_video):
         """動画メタデータ抽出のテスト"""
-        video_path = None
-        try:
-            video_path = self.create_test_video("mp4", "mp4v", duration_seconds=5)
-
-            # OpenCVで動画情報を取得
-            cap = cv2.VideoCapture(str(video_path))
+        # 読み込みテストで作成済みのMP4を再利用（メタデータはどの動画でも検証できる）
+        duration_seconds = 3
+        video_path = make_test_video("mp4", "mp4v", duration_seconds=duration_seconds)
 
+        # OpenCVで動画情報を取得
+        with _open_capture(video_path) as cap:
             fps = cap.get(cv2.CAP_PROP_FPS)
             frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
             width = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
             height = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
 
-            cap.release()
-
-            # メタデータが正しく取得できることを確認
-            assert fps == 30, f"FPSが正しくない: {fps}"
-            assert frame_count == 150, f"フレーム数が正しくない: {frame_count}"  # 5秒 × 30fps
-            assert width == 640, f"幅が正しくない: {width}"
-            assert height == 480, f"高さが正しくない: {height}"
-
-        finally:
-            if video_path and video_path.exists():
-                video_path.unlink()
+        # メタデータが正しく取得できることを確認
+        assert fps == 30, f"FPSが正しくない: {fps}"
+        assert frame_count == duration_seconds * 30, f"フレーム数が正しくない: {frame_count}"
+        assert width == 640, f"幅が正しくない: {width}"
+        assert height == 480, f"高さが正しくない: {height}"
 
 
 class TestSRTFormatSupport:
@@ -160,26 +229,22 @@ class TestSRTFormatSupport:
         [
             "utf-8",
             "utf-8-sig",  # BOM付きUTF-8
-            "utf-16",
+            pytest.param("utf-16", marks=pytest.mark.slow),  # SRTでは稀なため高速実行では除外
             "shift_jis",
             "euc-jp",
         ],
     )
-    def test_srt_encoding_support(self, sample_subtitles, encoding):
+    def test_srt_encoding_support(
+        self, tmp_path, sample_subtitles, encoding, srt_formatter, srt_parser
+    ):
         """SRT文字エンコーディング対応テスト"""
-        srt_path = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".srt", delete=False, encoding=encoding
-            ) as f:
-                srt_path = Path(f.name)
+        srt_path = tmp_path / f"encoding_{encoding}.srt"
 
+        try:
             # 指定エンコーディングでSRTファイルを書き出し
-            writer = SRTFormatter()
-
             # エンコーディングによっては特殊文字が扱えない場合がある
             try:
-                writer.save_srt_file(sample_subtitles, srt_path)
+                srt_formatter.save_srt_file(sample_subtitles, srt_path)
             except UnicodeEncodeError:
                 pytest.skip(f"エンコーディング {encoding} では特殊文字が扱えない")
 
@@ -187,8 +252,7 @@ class TestSRTFormatSupport:
             assert srt_path.exists(), f"SRTファイルが作成されていない ({encoding})"
 
             # SRTファイルを読み込み
-            reader = SRTParser()
-            loaded_subtitles = reader.parse_srt_file(srt_path)
+            loaded_subtitles = srt_parser.parse_srt_file(srt_path)
 
             # 読み込んだデータが元データと一致することを確認
             assert len(loaded_subtitles) == len(
@@ -203,41 +267,18 @@ class TestSRTFormatSupport:
         except (UnicodeError, LookupError):
             pytest.skip(f"エンコーディング {encoding} がサポートされていない")
 
-        finally:
-            if srt_path and srt_path.exists():
-                srt_path.unlink()
-
-    def test_srt_malformed_file_handling(self):
+    @pytest.mark.parametrize("content", MALFORMED_SRT_CONTENTS)
+    def test_srt_malformed_file_handling(self, tmp_path, content, srt_parser):
         """不正なSRTファイルの処理テスト"""
         # 不正なSRTファイルを作成
-        malformed_contents = [
-            # タイムコードが不正
-            "1\n99:99:99,999 --> 00:00:03,000\n不正なタイムコード\n\n",
-            # 番号が不正
-            "abc\n00:00:01,000 --> 00:00:03,000\n不正な番号\n\n",
-            # フォーマットが不正
-            "1\n不正なフォーマット\nテキスト\n\n",
-        ]
-
-        for i, content in enumerate(malformed_contents):
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".srt", delete=False, encoding="utf-8"
-            ) as f:
-                srt_path = Path(f.name)
-                f.write(content)
-
-            try:
-                reader = SRTParser()
+        srt_path = tmp_path / "malformed.srt"
+        srt_path.write_text(content, encoding="utf-8")
 
-                # 不正ファイルでもエラーハンドリングが働くことを確認
-                with pytest.raises(Exception):
-                    reader.parse_srt_file(srt_path)
+        # 不正ファイルでもエラーハンドリングが働くことを確認
+        with pytest.raises(Exception):
+            srt_parser.parse_srt_file(srt_path)
 
-            finally:
-                if srt_path.exists():
-                    srt_path.unlink()
-
-    def test_srt_special_characters_preservation(self):
+    def test_srt_special_characters_preservation(self, tmp_path, srt_formatter, srt_parser):
         """SRT特殊文字保持テスト"""
         special_subtitles = [
             SubtitleItem(1, 1000, 3000, "日本語テキスト"),
@@ -252,30 +293,21 @@ class TestSRTFormatSupport:
             SubtitleItem(10, 28000, 30000, "特殊記号: ©®™€$¥"),
         ]
 
-        srt_path = None
-        try:
-            with tempfile.NamedTemporaryFile(suffix=".srt", delete=False) as f:
-                srt_path = Path(f.name)
-
-            # UTF-8で書き出し
-            writer = SRTFormatter()
-            writer.save_srt_file(special_subtitles, srt_path)
+        srt_path = tmp_path / "out.srt"
 
-            # 読み込み
-            reader = SRTParser()
-            loaded_subtitles = reader.parse_srt_file(srt_path)
+        # UTF-8で書き出し
+        srt_formatter.save_srt_file(special_subtitles, srt_path)
 
-            # 特殊文字が保持されていることを確認
-            for original, loaded in zip(special_subtitles, loaded_subtitles):
-                assert (
-                    loaded.text == original.text
-                ), f"特殊文字が保持されていない: '{loaded.text}' != '{original.text}'"
+        # 読み込み
+        loaded_subtitles = srt_parser.parse_srt_file(srt_path)
 
-        finally:
-            if srt_path and srt_path.exists():
-                srt_path.unlink()
+        # 特殊文字が保持されていることを確認
+        for original, loaded in zip(special_subtitles, loaded_subtitles):
+            assert (
+                loaded.text == original.text
+            ), f"特殊文字が保持されていない: '{loaded.text}' != '{original.text}'"
 
-    def test_srt_timestamp_precision(self):
+    def test_srt_timestamp_precision(self, tmp_path, srt_formatter, srt_parser):
         """SRTタイムスタンプ精度テスト"""
         # ミリ秒単位の精密なタイムスタンプ
         precise_subtitles = [
@@ -284,126 +316,86 @@ class TestSRTFormatSupport:
             SubtitleItem(3, 5555, 6789, "5.555秒開始"),
         ]
 
-        srt_path = None
-        try:
-            with tempfile.NamedTemporaryFile(suffix=".srt", delete=False) as f:
-                srt_path = Path(f.name)
+        srt_path = tmp_path / "out.srt"
 
-            # 書き出し
-            writer = SRTFormatter()
-            writer.save_srt_file(precise_subtitles, srt_path)
+        # 書き出し
+        srt_formatter.save_srt_file(precise_subtitles, srt_path)
 
-            # 読み込み
-            reader = SRTParser()
-            loaded_subtitles = reader.parse_srt_file(srt_path)
-
-            # タイムスタンプの精度が保持されていることを確認
-            for original, loaded in zip(precise_subtitles, loaded_subtitles):
-                assert (
-                    loaded.start_ms == original.start_ms
-                ), f"開始時間の精度が失われた: {loaded.start_ms} != {original.start_ms}"
-                assert (
-                    loaded.end_ms == original.end_ms
-                ), f"終了時間の精度が失われた: {loaded.end_ms} != {original.end_ms}"
-
-        finally:
-            if srt_path and srt_path.exists():
-                srt_path.unlink()
-
-    def test_large_srt_file_performance(self):
+        # 読み込み
+        loaded_subtitles = srt_parser.parse_srt_file(srt_path)
+
+        # タイムスタンプの精度が保持されていることを確認
+        for original, loaded in zip(precise_subtitles, loaded_subtitles):
+            assert (
+                loaded.start_ms == original.start_ms
+            ), f"開始時間の精度が失われた: {loaded.start_ms} != {original.start_ms}"
+            assert (
+                loaded.end_ms == original.end_ms
+            ), f"終了時間の精度が失われた: {loaded.end_ms} != {original.end_ms}"
+
+    def test_large_srt_file_performance(self, tmp_path, srt_formatter, srt_parser):
         """大容量SRTファイルのパフォーマンステスト"""
         import time
 
         # 大量の字幕データを生成（1000項目）
-        large_subtitles = []
-        for i in range(1000):
-            start_ms = i * 2000
-            end_ms = start_ms + 1500
-            text = f"字幕 {i+1}: これは大容量ファイルのパフォーマンステスト用の長いテキストです。"
-            large_subtitles.append(SubtitleItem(i + 1, start_ms, end_ms, text))
-
-        srt_path = None
-        try:
-            with tempfile.NamedTemporaryFile(suffix=".srt", delete=False) as f:
-                srt_path = Path(f.name)
+        text_template = "字幕 {}: これは大容量ファイルのパフォーマンステスト用の長いテキストです。"
+        large_subtitles = [
+            SubtitleItem(i + 1, i * 2000, i * 2000 + 1500, text_template.format(i + 1))
+            for i in range(1000)
+        ]
 
-            # 書き出し時間を測定
-            writer = SRTFormatter()
-            start_time = time.time()
-            writer.save_srt_file(large_subtitles, srt_path)
-            write_time = time.time() - start_time
+        srt_path = tmp_path / "out.srt"
 
-            # 読み込み時間を測定
-            reader = SRTParser()
-            start_time = time.time()
-            loaded_subtitles = reader.parse_srt_file(srt_path)
-            read_time = time.time() - start_time
+        # 書き出し時間を測定
+        start_time = time.time()
+        srt_formatter.save_srt_file(large_subtitles, srt_path)
+        write_time = time.time() - start_time
 
-            # パフォーマンス検証
-            assert write_time < 2.0, f"書き出しが遅すぎる: {write_time:.2f}秒"
-            assert read_time < 2.0, f"読み込みが遅すぎる: {read_time:.2f}秒"
-            assert len(loaded_subtitles) == 1000, "大容量ファイルで字幕数が一致しない"
+        # 読み込み時間を測定
+        start_time = time.time()
+        loaded_subtitles = srt_parser.parse_srt_file(srt_path)
+        read_time = time.time() - start_time
 
-            # ファイルサイズ確認
-            file_size = srt_path.stat().st_size
-            assert file_size > 0, "ファイルが空"
+        # パフォーマンス検証
+        assert write_time < 2.0, f"書き出しが遅すぎる: {write_time:.2f}秒"
+        assert read_time < 2.0, f"読み込みが遅すぎる: {read_time:.2f}秒"
+        assert len(loaded_subtitles) == 1000, "大容量ファイルで字幕数が一致しない"
 
-        finally:
-            if srt_path and srt_path.exists():
-                srt_path.unlink()
+        # ファイルサイズ確認
+        file_size = srt_path.stat().st_size
+        assert file_size > 0, "ファイルが空"
 
 
 class TestFilePathHandling:
     """ファイルパス処理のテスト"""
 
-    def test_unicode_filename_support(self):
+    @pytest.mark.parametrize("unicode_name", UNICODE_FILENAMES)
+    def test_unicode_filename_support(self, tmp_path, srt_formatter, srt_parser, unicode_name):
         """Unicode文字を含むファイル名のサポートテスト"""
-        unicode_names = [
-            "日本語ファイル名.srt",
-            "файл_с_русским_именем.srt",
-            "archivo_español.srt",
-            "中文文件名.srt",
-            "한글파일명.srt",
-        ]
-
-        for unicode_name in unicode_names:
-            try:
-                srt_path = Path(tempfile.gettempdir()) / unicode_name
-
-                # テスト字幕データ
-                test_subtitles = [SubtitleItem(1, 1000, 3000, "テスト")]
+        try:
+            srt_path = tmp_path / unicode_name
 
-                # 書き出し
-                writer = SRTFormatter()
-                writer.save_srt_file(test_subtitles, srt_path)
+            # テスト字幕データ
+            test_subtitles = [SubtitleItem(1, 1000, 3000, "テスト")]
 
-                # ファイルが作成されていることを確認
-                assert (
-                    srt_path.exists()
-                ), f"Unicode文字を含むファイル名で作成できない: {unicode_name}"
+            # 書き出し
+            srt_formatter.save_srt_file(test_subtitles, srt_path)
 
-                # 読み込み
-                reader = SRTParser()
-                loaded_subtitles = reader.parse_srt_file(srt_path)
+            # ファイルが作成されていることを確認
+            assert srt_path.exists(), f"Unicode文字を含むファイル名で作成できない: {unicode_name}"
 
-                assert len(loaded_subtitles) == 1, "Unicode文字ファイル名で読み込みできない"
+            # 読み込み
+            loaded_subtitles = srt_parser.parse_srt_file(srt_path)
 
-            except (OSError, UnicodeError):
-                pytest.skip(f"システムがUnicodeファイル名をサポートしていない: {unicode_name}")
+            assert len(loaded_subtitles) == 1, "Unicode文字ファイル名で読み込みできない"
 
-            finally:
-                if srt_path.exists():
-                    srt_path.unlink()
+        except (OSError, UnicodeError):
+            pytest.skip(f"システムがUnicodeファイル名をサポートしていない: {unicode_name}")
 
-    def test_long_path_handling(self):
+    def test_long_path_handling(self, tmp_path, srt_formatter, srt_parser):
         """長いパス名の処理テスト"""
-        # 長いディレクトリ構造を作成
-        base_dir = Path(tempfile.gettempdir())
-
-        # 深いディレクトリ構造を作成
-        long_dir = base_dir
-        for i in range(10):
-            long_dir = long_dir / f"very_long_directory_name_{i}"
+        # 深いディレクトリ構造を作成（削除は tmp_path に任せる）
+        long_dir = tmp_path.joinpath(*(f"very_long_directory_name_{i}" for i in range(10)))
 
         try:
             long_dir.mkdir(parents=True, exist_ok=True)
@@ -413,64 +405,32 @@ class TestFilePathHandling:
             test_subtitles = [SubtitleItem(1, 1000, 3000, "長いパステスト")]
 
             # 書き出し
-            writer = SRTFormatter()
-            writer.save_srt_file(test_subtitles, srt_path)
+            srt_formatter.save_srt_file(test_subtitles, srt_path)
 
             # 読み込み
-            reader = SRTParser()
-            loaded_subtitles = reader.parse_srt_file(srt_path)
+            loaded_subtitles = srt_parser.parse_srt_file(srt_path)
 
             assert len(loaded_subtitles) == 1, "長いパスで処理できない"
 
         except OSError:
             pytest.skip("システムが長いパス名をサポートしていない")
 
-        finally:
-            # クリーンアップ
-            try:
-                if srt_path.exists():
-                    srt_path.unlink()
-                # ディレクトリを削除（空の場合のみ）
-                for parent in reversed(list(long_dir.parents)):
-                    try:
-                        if parent != base_dir:
-                            parent.rmdir()
-                    except OSError:
-                        break
-            except OSError:
-                pass
-
-    def test_special_characters_in_path(self):
+    @pytest.mark.parametrize("special_path", SPECIAL_CHARACTER_FILENAMES)
+    def test_special_characters_in_path(self, tmp_path, srt_formatter, srt_parser, special_path):
         """パスに特殊文字を含む場合のテスト"""
-        special_chars_paths = [
-            "file with spaces.srt",
-            "file-with-dashes.srt",
-            "file_with_underscores.srt",
-            "file.with.dots.srt",
-            "file(with)parentheses.srt",
-            "file[with]brackets.srt",
-        ]
-
-        for special_path in special_chars_paths:
-            try:
-                srt_path = Path(tempfile.gettempdir()) / special_path
-
-                # テスト字幕データ
-                test_subtitles = [SubtitleItem(1, 1000, 3000, "特殊文字パステスト")]
+        try:
+            srt_path = tmp_path / special_path
 
-                # 書き出し
-                writer = SRTFormatter()
-                writer.save_srt_file(test_subtitles, srt_path)
+            # テスト字幕データ
+            test_subtitles = [SubtitleItem(1, 1000, 3000, "特殊文字パステスト")]
 
-                # 読み込み
-                reader = SRTParser()
-                loaded_subtitles = reader.parse_srt_file(srt_path)
+            # 書き出し
+            srt_formatter.save_srt_file(test_subtitles, srt_path)
 
-                assert len(loaded_subtitles) == 1, f"特殊文字パスで処理できない: {special_path}"
+            # 読み込み
+            loaded_subtitles = srt_parser.parse_srt_file(srt_path)
 
-            except OSError:
-                pytest.skip(f"システムが特殊文字パスをサポートしていない: {special_path}")
+            assert len(loaded_subtitles) == 1, f"特殊文字パスで処理できない: {special_path}"
 
-            finally:
-                if srt_path.exists():
-                    srt_path.unlink()
+        except OSError:
+            pytest.skip(f"システムが特殊文字パスをサポートしていない: {special_path}")
@@ -4,47 +4,18 @@
 PRコメント対応版 - assert文使用
 """
 
-import sys
-from dataclasses import dataclass
-from pathlib import Path
-from typing import List, Optional, Tuple
-
-# プロジェクトルートをPythonパスに追加
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-# 実際のコードをインポート
-try:
-    from app.core.extractor.group import ExtractionProcessor
-    from app.core.models import SubtitleItem
-
-    REAL_CODE_AVAILABLE = True
-except ImportError as e:
-    print(f"実際のコードをインポートできません: {e}")
-    print("スタンドアロン版でテストを実行します")
-    REAL_CODE_AVAILABLE = False
-
-    # フォールバック用モック
-    @dataclass
-    class SubtitleItem:
-        index: int
-        start_ms: int
-        end_ms: int
-        text: str
-        bbox: Optional[Tuple[int, int, int, int]] = None
-
-    class ExtractionProcessor:
-        def __init__(self, settings):
-            pass
-
-        def _remove_duplicates(self, subtitles):
-            # 実際のロジックが使用できない場合のフォールバック
-            return subtitles[:6]  # 期待値に合わせる
+import pytest
+
+from app.core.models import SubtitleItem
+
+# group モジュールは cv2 等を間接的に読み込むため、利用できない環境ではスキップ
+ExtractionProcessor = pytest.importorskip(
+    "app.core.extractor.group", reason="ExtractionProcessor の依存関係が利用できない"
+).ExtractionProcessor
 
 
 def test_integration_duplicate_merge():
     """統合テスト: 実際のExtractionProcessorを使った重複統合"""
-    print("=== 統合テスト: ExtractionProcessorを使った重複統合 ===")
-
     # 実際のtest_video.ja.srtのケース
     subtitles = [
         SubtitleItem(
@@ -103,8 +74,6 @@ def test_integration_duplicate_merge():
         ),
     ]
 
-    print(f"元の字幕数: {len(subtitles)}")
-
     # 実際のExtractionProcessorを使用
     settings = {
         "similarity_threshold": 0.90,
@@ -114,51 +83,26 @@ def test_integration_duplicate_merge():
 
     processor = ExtractionProcessor(settings)
 
-    try:
-        merged_subtitles = processor._remove_duplicates(subtitles)
-        print(f"統合後字幕数: {len(merged_subtitles)}")
-
-        if REAL_CODE_AVAILABLE:
-            print("\n統合結果:")
-            for subtitle in merged_subtitles:
-                print(f"字幕 {subtitle.index}: {subtitle.start_ms}-{subtitle.end_ms}ms")
-                print(f"  テキスト: {subtitle.text[:50]}...")
-
-            # assert文で期待値の確認
-            expected_count = 6
-            assert (
-                len(merged_subtitles) == expected_count
-            ), f"期待値 {expected_count} != 実際 {len(merged_subtitles)}"
-            print(f"\n✅ テスト成功: {expected_count}字幕に統合されました")
-
-            # 重複統合の確認
-            library_found = any("図書館" in s.text for s in merged_subtitles)
-            shower_found = any(
-                "シャワー" in s.text or "シヤワー" in s.text for s in merged_subtitles
-            )
-            curry_found = any("カレー蕎麦" in s.text for s in merged_subtitles)
-
-            assert library_found, "図書館関連の字幕が統合されていません"
-            assert shower_found, "シャワー関連の字幕が統合されていません"
-            assert curry_found, "カレー蕎麦関連の字幕が統合されていません"
-            print("✅ 全ての重複字幕が正しく統合されました")
-        else:
-            print("⚠️ スタンドアロン版でテスト実行（実際のコードの動作確認は不可）")
-
-    except Exception as e:
-        if "cv2" in str(e):
-            print(f"⚠️ cv2依存関係のため実際のコードをテストできません: {e}")
-            print("CI環境ではcv2がインストールされている前提でテストが実行されます")
-        else:
-            raise
-
-    return True
+    merged_subtitles = processor._remove_duplicates(subtitles)
+
+    # assert文で期待値の確認
+    expected_count = 6
+    assert (
+        len(merged_subtitles) == expected_count
+    ), f"期待値 {expected_count} != 実際 {len(merged_subtitles)}"
+
+    # 重複統合の確認
+    library_found = any("図書館" in s.text for s in merged_subtitles)
+    shower_found = any("シャワー" in s.text or "シヤワー" in s.text for s in merged_subtitles)
+    curry_found = any("カレー蕎麦" in s.text for s in merged_subtitles)
+
+    assert library_found, "図書館関連の字幕が統合されていません"
+    assert shower_found, "シャワー関連の字幕が統合されていません"
+    assert curry_found, "カレー蕎麦関連の字幕が統合されていません"
 
 
 def test_time_constraint_behavior():
     """時間制約の動作をテスト"""
-    print("\n=== 時間制約の動作テスト ===")
-
     # 時間的に離れた同一テキスト（統合されないことを確認）
     subtitles = [
         SubtitleItem(index=1, start_ms=1000, end_ms=2000, text="ありがとうございます"),
@@ -176,58 +120,9 @@ def test_time_constraint_behavior():
 
     processor = ExtractionProcessor(settings)
 
-    try:
-        merged_subtitles = processor._remove_duplicates(subtitles)
-        print(f"元の字幕数: {len(subtitles)}")
-        print(f"統合後字幕数: {len(merged_subtitles)}")
-
-        if REAL_CODE_AVAILABLE:
-            # 時間制約により統合されないことを確認
-            assert (
-                len(merged_subtitles) == 3
-            ), f"時間制約により統合されないはず: {len(merged_subtitles)}"
-            thanks_count = sum(1 for s in merged_subtitles if s.text == "ありがとうございます")
-            assert thanks_count == 2, f"「ありがとうございます」が2つ残るはず: {thanks_count}"
-            print("✅ 時間制約が正しく動作しています")
-        else:
-            print("⚠️ スタンドアロン版のため時間制約テストをスキップ")
-
-    except Exception as e:
-        if "cv2" in str(e):
-            print(f"⚠️ cv2依存関係のため実際のコードをテストできません: {e}")
-        else:
-            raise
-
-    return True
-
-
-if __name__ == "__main__":
-    print("重複統合機能の統合テスト開始...\n")
-
-    success_count = 0
-    total_tests = 2
-
-    try:
-        if test_integration_duplicate_merge():
-            success_count += 1
-    except AssertionError as e:
-        print(f"❌ test_integration_duplicate_merge失敗: {e}")
-    except Exception as e:
-        print(f"⚠️ test_integration_duplicate_merge エラー: {e}")
-
-    try:
-        if test_time_constraint_behavior():
-            success_count += 1
-    except AssertionError as e:
-        print(f"❌ test_time_constraint_behavior失敗: {e}")
-    except Exception as e:
-        print(f"⚠️ test_time_constraint_behavior エラー: {e}")
-
-    print(f"\n=== テスト結果: {success_count}/{total_tests} 成功 ===")
-
-    if success_count == total_tests:
-        print("🎉 すべてのテストが成功しました！")
-    else:
-        print("❌ 一部のテストが失敗しました")
-        if REAL_CODE_AVAILABLE:
-            raise SystemExit(1)
+    merged_subtitles = processor._remove_duplicates(subtitles)
+
+    # 時間制約により統合されないことを確認
+    assert len(merged_subtitles) == 3, f"時間制約により統合されないはず: {len(merged_subtitles)}"
+    thanks_count = sum(1 for s in merged_subtitles if s.text == "ありがとうございます")
+    assert thanks_count == 2, f"「ありがとうございます」が2つ残るはず: {thanks_count}"
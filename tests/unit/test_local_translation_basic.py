@@ -2,11 +2,8 @@
 ローカル翻訳機能の基本テスト（依存関係なし）
 """
 
-import shutil
-import tempfile
+import copy
 import unittest
-from pathlib import Path
-from unittest.mock import Mock, patch
 
 from app.core.translate import (
     TranslationProviderRouter,
@@ -18,22 +15,28 @@ from app.core.translate import (
 class TestBasicTranslationProviderRouter(unittest.TestCase):
     """翻訳プロバイダールーターの基本テスト"""
 
+    @classmethod
+    def setUpClass(cls):
+        """MOCKプロバイダー登録済みのルーターを一度だけ構築"""
+        cls._base_router = TranslationProviderRouter()
+        cls._base_router.register_provider(TranslationProviderType.MOCK, None)
+
     def setUp(self):
         """テスト準備"""
-        self.router = TranslationProviderRouter()
+        # テスト間で登録状態を共有しないよう複製して使う
+        self.router = copy.deepcopy(self._base_router)
 
     def test_mock_provider_registration(self):
         """モックプロバイダー登録のテスト"""
-        result = self.router.register_provider(TranslationProviderType.MOCK, None)
+        router = TranslationProviderRouter()
+        result = router.register_provider(TranslationProviderType.MOCK, None)
 
         self.assertTrue(result)
-        self.assertIn(TranslationProviderType.MOCK, self.router.get_available_providers())
-        self.assertEqual(self.router.default_provider, TranslationProviderType.MOCK)
+        self.assertIn(TranslationProviderType.MOCK, router.get_available_providers())
+        self.assertEqual(router.default_provider, TranslationProviderType.MOCK)
 
     def test_mock_translation(self):
         """モック翻訳のテスト"""
-        self.router.register_provider(TranslationProviderType.MOCK, None)
-
         texts = ["こんにちは", "ありがとう"]
         result = self.router.translate_batch(
             texts=texts, target_language="en", source_language="ja"
@@ -47,8 +50,6 @@ class TestBasicTranslationProviderRouter(unittest.TestCase):
 
     def test_empty_text_translation(self):
         """空テキスト翻訳のテスト"""
-        self.router.register_provider(TranslationProviderType.MOCK, None)
-
         result = self.router.translate_batch(texts=[], target_language="en", source_language="ja")
 
         self.assertTrue(result.success)
@@ -59,14 +60,11 @@ class TestBasicTranslationProviderRouter(unittest.TestCase):
         # 未登録プロバイダー
         self.assertFalse(self.router.is_provider_available(TranslationProviderType.LOCAL))
 
-        # プロバイダー登録後
-        self.router.register_provider(TranslationProviderType.MOCK, None)
+        # 登録済みプロバイダー
         self.assertTrue(self.router.is_provider_available(TranslationProviderType.MOCK))
 
     def test_supported_languages(self):
         """サポート言語のテスト"""
-        self.router.register_provider(TranslationProviderType.MOCK, None)
-
         languages = self.router.get_supported_languages()
 
         self.assertIn("ja", languages)
@@ -76,9 +74,6 @@ class TestBasicTranslationProviderRouter(unittest.TestCase):
 
     def test_multi_language_translation_workflow(self):
         """多言語翻訳ワークフローテスト"""
-        router = TranslationProviderRouter()
-        router.register_provider(TranslationProviderType.MOCK, None)
-
         # 日本語字幕のサンプルデータ
         subtitle_texts = [
             "おはようございます",
@@ -91,7 +86,7 @@ class TestBasicTranslationProviderRouter(unittest.TestCase):
 
         for lang in target_languages:
             with self.subTest(language=lang):
-                result = router.translate_batch(
+                result = self.router.translate_batch(
                     texts=subtitle_texts, target_language=lang, source_language="ja"
                 )
 
@@ -102,9 +97,6 @@ class TestBasicTranslationProviderRouter(unittest.TestCase):
 
     def test_fallback_provider_functionality(self):
         """フォールバックプロバイダー機能のテスト"""
-        # モックプロバイダーを登録
-        self.router.register_provider(TranslationProviderType.MOCK, None)
-
         # フォールバック設定
         self.router.set_fallback_providers([TranslationProviderType.MOCK])
 
@@ -122,7 +114,8 @@ class TestBasicTranslationProviderRouter(unittest.TestCase):
     def test_error_handling_no_providers(self):
         """プロバイダーなしでのエラーハンドリング"""
         # プロバイダーを登録しない状態で翻訳実行
-        result = self.router.translate_batch(
+        router = TranslationProviderRouter()
+        result = router.translate_batch(
             texts=["テスト"], target_language="en", source_language="ja"
         )
 
@@ -131,8 +124,6 @@ class TestBasicTranslationProviderRouter(unittest.TestCase):
 
     def test_translation_result_structure(self):
         """翻訳結果構造のテスト"""
-        self.router.register_provider(TranslationProviderType.MOCK, None)
-
         result = self.router.translate_batch(
             texts=["テスト"], target_language="en", source_language="ja"
         )
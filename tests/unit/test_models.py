@@ -2,11 +2,9 @@
 modelsモジュールのテスト
 """
 
-import json
+import io
 from pathlib import Path
 
-import pytest
-
 from app.core.models import Project, ProjectSettings, QCResult, SubtitleItem
 
 
@@ -103,9 +101,26 @@ class TestProject:
         assert len(project.subtitles) == 3
         assert isinstance(project.settings, ProjectSettings)
 
-    def test_save_load(self, sample_subtitles, temp_dir):
-        """保存・読み込みテスト"""
-        project_path = temp_dir / "test.subproj"
+    def test_save_load_roundtrip(self, sample_subtitles, monkeypatch):
+        """保存・読み込みテスト（ディスクの代わりにメモリ上のバッファを使用）"""
+        files = {}
+
+        class _MemoryFile(io.StringIO):
+            def __init__(self, filepath, mode):
+                super().__init__(files.get(str(filepath), "") if "r" in mode else "")
+                self._filepath = str(filepath)
+                self._writable = "w" in mode
+
+            def close(self):
+                if self._writable and not self.closed:
+                    files[self._filepath] = self.getvalue()
+                super().close()
+
+        def _memory_open(filepath, mode="r", encoding=None):
+            return _MemoryFile(filepath, mode)
+
+        monkeypatch.setattr("app.core.models.open", _memory_open, raising=False)
+        project_path = Path("/virtual/test.subproj")
 
         # プロジェクト作成・保存
         project = Project(
@@ -114,6 +129,7 @@ class TestProject:
             subtitles=sample_subtitles,
         )
         project.save(project_path)
+        assert str(project_path) in files
 
         # 読み込み
         loaded_project = Project.load(project_path)
@@ -3,13 +3,12 @@
 """
 
 import json
-import tempfile
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 
+import app.core.project_manager as _pm_mod
 from app.core.models import SubtitleItem
 from app.core.project_manager import ProjectData, ProjectManager, ProjectMetadata
 
@@ -124,6 +123,63 @@ class TestProjectManager:
         assert subtitle_items[0].start_ms == 1000
         assert subtitle_items[0].end_ms == 3000
 
+    def test_save_load_without_orjson(
+        self, project_manager, sample_project_data, temp_project_dir, monkeypatch
+    ):
+        """orjsonがない環境（標準jsonへのフォールバック）での保存・読み込みテスト"""
+        monkeypatch.setattr("app.core.project_manager.ORJSON_AVAILABLE", False)
+        temp_project_dir.mkdir(parents=True, exist_ok=True)
+        project_file = temp_project_dir / "test.subproj"
+
+        assert project_manager.save_project(sample_project_data, project_file)
+        loaded_data = ProjectManager().load_project(project_file)
+
+        assert loaded_data.metadata.name == "テストプロジェクト"
+        assert len(loaded_data.subtitles) == 2
+
+    @pytest.mark.parametrize(
+        "write_with_orjson", [True, False], ids=["orjson_to_json", "json_to_orjson"]
+    )
+    def test_save_load_across_json_backends(
+        self, sample_project_data, temp_project_dir, monkeypatch, write_with_orjson
+    ):
+        """orjsonと標準jsonの一方で保存したファイルをもう一方で読み込めるかのテスト"""
+        pytest.importorskip("orjson")
+        temp_project_dir.mkdir(parents=True, exist_ok=True)
+        project_file = temp_project_dir / "test.subproj"
+
+        monkeypatch.setattr("app.core.project_manager.ORJSON_AVAILABLE", write_with_orjson)
+        assert ProjectManager().save_project(sample_project_data, project_file)
+
+        # 両方の読み込み方式で同じ内容になること
+        monkeypatch.setattr("app.core.project_manager.ORJSON_AVAILABLE", True)
+        orjson_dict = _pm_mod._read_json(project_file)
+        monkeypatch.setattr("app.core.project_manager.ORJSON_AVAILABLE", False)
+        json_dict = _pm_mod._read_json(project_file)
+        assert orjson_dict == json_dict
+
+        monkeypatch.setattr("app.core.project_manager.ORJSON_AVAILABLE", not write_with_orjson)
+        loaded_data = ProjectManager().load_project(project_file)
+
+        assert loaded_data.metadata.name == "テストプロジェクト"
+        assert loaded_data.subtitles == sample_project_data.subtitles
+        assert loaded_data.translations == sample_project_data.translations
+
+    def test_load_large_project_via_mmap(
+        self, project_manager, sample_project_data, temp_project_dir, monkeypatch
+    ):
+        """mmap経由の読み込みパス（大きなプロジェクトファイル）のテスト"""
+        pytest.importorskip("orjson")
+        monkeypatch.setattr("app.core.project_manager._MMAP_THRESHOLD_BYTES", 1)
+        temp_project_dir.mkdir(parents=True, exist_ok=True)
+        project_file = temp_project_dir / "test.subproj"
+
+        assert project_manager.save_project(sample_project_data, project_file)
+        loaded_data = ProjectManager().load_project(project_file)
+
+        assert loaded_data.metadata.name == "テストプロジェクト"
+        assert len(loaded_data.subtitles) == 2
+
     def test_load_nonexistent_project(self, project_manager):
         """存在しないプロジェクトファイルの処理テスト"""
         with pytest.raises(FileNotFoundError):
@@ -291,12 +347,13 @@ class TestProjectManager:
         video_file.touch()  # 空のファイルを作成
 
         # 相対パスでプロジェクトデータを作成
+        now = datetime.now().isoformat()
         project_data = ProjectData(
             metadata=ProjectMetadata(
                 id="test-relative",
                 name="相対パステスト",
-                created_at=datetime.now().isoformat(),
-                modified_at=datetime.now().isoformat(),
+                created_at=now,
+                modified_at=now,
             ),
             video_file_path="videos/test_video.mp4",  # 相対パス
             subtitles=[],
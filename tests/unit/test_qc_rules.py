@@ -2,8 +2,6 @@
 QCルールモジュールのテスト
 """
 
-import pytest
-
 from app.core.models import QCResult, SubtitleItem
 from app.core.qc.rules import (
     DuplicateTextRule,
@@ -12,7 +10,6 @@ from app.core.qc.rules import (
     LineLengthRule,
     MaxLinesRule,
     QCChecker,
-    QCSeverity,
     ReadingSpeedRule,
     TimeOrderRule,
     TimeOverlapRule,
@@ -131,6 +128,54 @@ class TestTimeOverlapRule:
         assert results[0].severity == "error"
         assert "重複" in results[0].message
 
+    def test_overlap_with_non_adjacent_subtitles(self):
+        """隣接しない字幕との重複も検出されるかのテスト"""
+        rule = TimeOverlapRule()
+        subtitles = [
+            SubtitleItem(1, 1000, 9000, "長い字幕"),
+            SubtitleItem(2, 2000, 3000, "字幕2"),
+            SubtitleItem(3, 4000, 5000, "字幕3"),
+        ]
+
+        results = rule.check(subtitles)
+        assert [result.subtitle_index for result in results] == [0, 0]
+        assert "字幕2と" in results[0].message
+        assert "字幕3と" in results[1].message
+
+    def test_overlap_with_unsorted_subtitles(self):
+        """開始時間順に並んでいない字幕でも元の順序で報告されるかのテスト"""
+        rule = TimeOverlapRule()
+        subtitles = [
+            SubtitleItem(1, 8000, 9000, "字幕1"),
+            SubtitleItem(2, 1000, 3000, "字幕2"),
+            SubtitleItem(3, 2500, 8500, "字幕3"),
+        ]
+
+        results = rule.check(subtitles)
+        assert [result.subtitle_index for result in results] == [0, 1]
+        assert "字幕3と" in results[0].message
+        assert "字幕3と" in results[1].message
+
+    def test_overlap_with_long_spanning_subtitle(self):
+        """全体にかかる長い字幕があっても重複だけが正しく報告されるかのテスト"""
+        rule = TimeOverlapRule()
+        short_count = 2000
+        subtitles = [SubtitleItem(1, 0, short_count * 1000, "長い字幕")]
+        subtitles += [
+            SubtitleItem(i + 2, i * 1000 + 100, i * 1000 + 600, f"字幕{i + 2}")
+            for i in range(short_count)
+        ]
+        # 短い字幕同士の重複も1組含める
+        subtitles.append(SubtitleItem(short_count + 2, 500, 800, "重複する短い字幕"))
+
+        results = rule.check(subtitles)
+        assert len(results) == short_count + 2
+        assert [result.subtitle_index for result in results[: short_count + 1]] == [0] * (
+            short_count + 1
+        )
+        assert results[-1].subtitle_index == 1
+        assert f"字幕{short_count + 2}と" in results[-1].message
+
 
 class TestDuplicateTextRule:
     """DuplicateTextRuleのテスト"""
@@ -3,8 +3,10 @@
 実際のtest_video.ja.srtの重複ケースを使ったテスト（assert文版）
 """
 
+import operator
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -12,7 +14,7 @@ from typing import List, Optional, Tuple
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockSubtitleItem:
     """SubtitleItem のモック"""
 
@@ -23,9 +25,20 @@ class MockSubtitleItem:
     bbox: Optional[Tuple[int, int, int, int]] = None
 
 
+# 正規化で取り除く空白・句読点と、OCR誤認識で取り違えやすい「口」の「ロ」への統一
+_NORMALIZE_TABLE = str.maketrans("口", "ロ", " 、。")
+
+
 class MockTextSimilarityCalculator:
     """TextSimilarityCalculator のモック"""
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def normalize(text: str) -> str:
+        """比較用の正規化テキスト（同じテキストは一度だけ計算）"""
+        # OCR誤認識パターンの補正（「シヤ」は2文字のため変換表とは別に置換）
+        return text.lower().translate(_NORMALIZE_TABLE).replace("シヤ", "シャ")
+
     @staticmethod
     def calculate_similarity(text1: str, text2: str) -> float:
         """簡単な類似度計算"""
@@ -35,31 +48,20 @@ class MockTextSimilarityCalculator:
         if text1 == text2:
             return 1.0
 
-        # 正規化
-        norm_text1 = text1.lower().replace(" ", "").replace("、", "").replace("。", "")
-        norm_text2 = text2.lower().replace(" ", "").replace("、", "").replace("。", "")
-
-        if norm_text1 == norm_text2:
-            return 1.0
-
-        # OCR誤認識パターンの補正
-        corrections = {"シヤ": "シャ", "ロ": "口", "口": "ロ"}
-
-        for wrong, correct in corrections.items():
-            norm_text1 = norm_text1.replace(wrong, correct)
-            norm_text2 = norm_text2.replace(wrong, correct)
+        # 正規化（補正前に一致するテキストは補正後も一致する）
+        norm_text1 = MockTextSimilarityCalculator.normalize(text1)
+        norm_text2 = MockTextSimilarityCalculator.normalize(text2)
 
         if norm_text1 == norm_text2:
             return 1.0
 
-        # 長さ比
-        len_ratio = min(len(norm_text1), len(norm_text2)) / max(len(norm_text1), len(norm_text2))
-        if len_ratio < 0.8:
+        # 長さ比（min / max < 0.8 を整数演算で判定）
+        if min(len(norm_text1), len(norm_text2)) * 5 < max(len(norm_text1), len(norm_text2)) * 4:
             return 0.0
 
         # 位置一致の類似度
-        min_len = min(len(norm_text1), len(norm_text2))
-        common_chars = sum(1 for i in range(min_len) if norm_text1[i] == norm_text2[i])
+        # map は短い方の長さで止まるため、先頭から短い方の文字数分の位置一致数になる
+        common_chars = sum(map(operator.eq, norm_text1, norm_text2))
         max_len = max(len(norm_text1), len(norm_text2))
 
         return common_chars / max_len
@@ -76,28 +78,31 @@ def merge_time_constrained_duplicates(
     calc = MockTextSimilarityCalculator()
     max_merge_gap_ms = 30000  # 30秒以内の字幕のみ統合対象
 
-    subtitles_copy = subtitles.copy()
-    i = 0
-    while i < len(subtitles_copy):
-        current_group = [subtitles_copy[i]]
-        j = i + 1
+    # 統合済みの字幕を印で管理する（リストのコピーと pop を避ける）
+    consumed = bytearray(len(subtitles))
+    for i in range(len(subtitles)):
+        if consumed[i]:
+            continue
+
+        current_group = [subtitles[i]]
 
         # 現在の字幕から30秒以内の類似字幕を探す
-        while j < len(subtitles_copy):
-            time_gap = subtitles_copy[j].start_ms - subtitles_copy[i].end_ms
+        for j in range(i + 1, len(subtitles)):
+            if consumed[j]:
+                continue
+
+            time_gap = subtitles[j].start_ms - subtitles[i].end_ms
 
             # 時間間隔が30秒を超えたら統合対象外
             if time_gap > max_merge_gap_ms:
                 break
 
             # テキスト類似度チェック
-            similarity = calc.calculate_similarity(subtitles_copy[i].text, subtitles_copy[j].text)
+            similarity = calc.calculate_similarity(subtitles[i].text, subtitles[j].text)
 
             if similarity > 0.90:
-                current_group.append(subtitles_copy[j])
-                subtitles_copy.pop(j)
-            else:
-                j += 1
+                current_group.append(subtitles[j])
+                consumed[j] = 1
 
         # グループを統合して追加
         if len(current_group) == 1:
@@ -106,8 +111,6 @@ def merge_time_constrained_duplicates(
             merged_subtitle = merge_duplicate_group(current_group)
             merged.append(merged_subtitle)
 
-        i += 1
-
     return merged
 
 
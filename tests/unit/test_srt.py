@@ -2,10 +2,6 @@
 SRTフォーマットモジュールのテスト
 """
 
-from pathlib import Path
-
-import pytest
-
 from app.core.format.srt import MultiLanguageSRTManager, SRTFormatter, SRTParser
 from app.core.models import SubtitleItem
 
@@ -13,7 +13,7 @@ from typing import List, Optional, Tuple
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockSubtitleItem:
     """SubtitleItem のモック"""
 